@@ -11,10 +11,11 @@ import logging
 from datetime import datetime
 
 from flask import Flask
-from apscheduler.schedulers.background import BackgroundScheduler
+from sqlalchemy import event
+from sqlalchemy.schema import CreateIndex
 
 from config import Config
-from models import db, TargetCompany
+from models import db, Job, TargetCompany
 
 # ── Logging ──────────────────────────────────────────────────────
 os.makedirs(Config.LOG_DIR, exist_ok=True)
@@ -44,22 +45,161 @@ def create_app() -> Flask:
     db.init_app(app)
 
     with app.app_context():
+        _configure_sqlite(app)
         db.create_all()
+        _create_missing_indexes()
+        _drop_redundant_indexes()
+        _create_trigram_indexes()
+        _create_search_tsv(app)
+        _migrate_url_hash()
         _seed_target_companies(app)
 
     # Register blueprints
     from routes.api import api_bp
     from routes.views import views_bp
+    from routes.internal import internal_bp
     app.register_blueprint(api_bp)
     app.register_blueprint(views_bp)
-
-    # Start scheduler
-    _start_scheduler(app)
+    app.register_blueprint(internal_bp)
 
     logger.info("UK Skilled Jobs Portal started")
     return app
 
 
+# ── SQLite tuning ───────────────────────────────────────────────
+def _configure_sqlite(app: Flask):
+    """Run the configured PRAGMAs on each new SQLite connection."""
+    if not app.config.get('IS_SQLITE'):
+        return
+
+    pragmas = app.config['SQLITE_PRAGMAS']
+
+    @event.listens_for(db.engine, 'connect')
+    def _set_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        for pragma in pragmas:
+            cursor.execute(f'PRAGMA {pragma}')
+        cursor.close()
+
+    @event.listens_for(db.engine, 'close')
+    def _optimize(dbapi_conn, _record):
+        # Keeps ANALYZE statistics fresh for the composite indexes
+        dbapi_conn.execute('PRAGMA optimize')
+
+
+# ── Schema migrations ───────────────────────────────────────────
+def _create_missing_indexes():
+    """Add indexes declared on Job that an older database lacks.
+
+    ``db.create_all()`` only creates missing tables, not new indexes on
+    tables that already exist.  IF NOT EXISTS rather than ``checkfirst``,
+    which relies on reflection and can't see expression indexes.
+    """
+    for index in Job.__table__.indexes:
+        db.session.execute(CreateIndex(index, if_not_exists=True))
+    db.session.commit()
+
+
+def _drop_redundant_indexes():
+    """Drop single-column indexes now covered by composite ones.
+
+    ``uq_job_url_date`` leads with url_hash and the scrape_date composites
+    lead with scrape_date, so these only cost extra writes per insert.
+    """
+    for name in ('ix_jobs_url_hash', 'ix_jobs_scrape_date'):
+        db.session.execute(db.text(f'DROP INDEX IF EXISTS {name}'))
+    db.session.commit()
+
+
+def _create_trigram_indexes():
+    """Add pg_trgm GIN indexes behind the ``%term%`` ILIKE job search.
+
+    A leading-wildcard ILIKE can't use a B-tree index; with these the
+    PostgreSQL planner answers the title/company/location search from an
+    index instead of scanning the date range.  SQLite is left as is.
+    """
+    if db.engine.dialect.name != 'postgresql':
+        return
+
+    try:
+        db.session.execute(db.text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+        for column in ('title', 'company', 'location'):
+            db.session.execute(db.text(
+                f'CREATE INDEX IF NOT EXISTS ix_jobs_{column}_trgm '
+                f'ON jobs USING gin ({column} gin_trgm_ops)'
+            ))
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"Could not create pg_trgm search indexes: {e}")
+
+
+def _create_search_tsv(app: Flask):
+    """Add a generated ``jobs.search_tsv`` column with a GIN index.
+
+    It tokenises title, company and location together, so a multi-word
+    search like "engineer london" can match across fields with a single
+    index probe.  Sets ``SEARCH_TSV`` so the job search only uses the
+    column where it exists (PostgreSQL 12+).
+    """
+    app.config['SEARCH_TSV'] = False
+    if db.engine.dialect.name != 'postgresql':
+        return
+
+    try:
+        db.session.execute(db.text(
+            "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_tsv tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('simple', "
+            "coalesce(title, '') || ' ' || coalesce(company, '') || ' ' || "
+            "coalesce(location, ''))) STORED"
+        ))
+        db.session.execute(db.text(
+            'CREATE INDEX IF NOT EXISTS ix_jobs_search_tsv '
+            'ON jobs USING gin (search_tsv)'
+        ))
+        db.session.commit()
+        app.config['SEARCH_TSV'] = True
+    except Exception as e:
+        db.session.rollback()
+        logger.warning(f"Could not create jobs.search_tsv: {e}")
+
+
+def _migrate_url_hash():
+    """Convert legacy hex ``jobs.url_hash`` values to raw 16-byte digests.
+
+    Older databases stored the first 32 hex chars of the SHA-256 digest;
+    ``scraper.dedup.url_hash`` now returns those same 16 bytes unencoded.
+    """
+    dialect = db.engine.dialect.name
+
+    if dialect == 'sqlite':
+        # SQLite keeps the declared VARCHAR type; only the values change
+        rows = db.session.execute(db.text(
+            "SELECT id, url_hash FROM jobs WHERE typeof(url_hash) = 'text'"
+        )).all()
+        if not rows:
+            return
+        db.session.execute(
+            db.text("UPDATE jobs SET url_hash = :h WHERE id = :id"),
+            [{'id': r.id, 'h': bytes.fromhex(r.url_hash[:32])} for r in rows],
+        )
+        db.session.commit()
+        logger.info(f"Migrated {len(rows)} url_hash values to binary")
+
+    elif dialect == 'postgresql':
+        col_type = db.session.execute(db.text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = 'jobs' AND column_name = 'url_hash'"
+        )).scalar()
+        if col_type and col_type != 'bytea':
+            db.session.execute(db.text(
+                "ALTER TABLE jobs ALTER COLUMN url_hash TYPE BYTEA "
+                "USING decode(substr(url_hash, 1, 32), 'hex')"
+            ))
+            db.session.commit()
+            logger.info("Migrated jobs.url_hash column to BYTEA")
+
+
 # ── Seed target companies from JSON ─────────────────────────────
 def _seed_target_companies(app: Flask):
     """Load target companies from the JSON file.
@@ -68,9 +208,8 @@ def _seed_target_companies(app: Flask):
       - Legacy list of strings: ["Company A", "Company B"]
       - New list of objects:    [{"name": "Company A", "career_url": "https://..."}]
 
-    On first run (empty table) it inserts all entries.
-    On subsequent runs it updates career_url for existing companies
-    and adds any new companies found in the file.
+    Companies not yet in the table are inserted in one batch; existing
+    companies get their career_url updated when the file has a new one.
     """
     with app.app_context():
         path = app.config['TARGET_COMPANIES_FILE']
@@ -78,62 +217,76 @@ def _seed_target_companies(app: Flask):
             logger.warning(f"Target companies file not found: {path}")
             return
 
-        with open(path, 'r') as f:
+        with open(path, 'rb') as f:
             raw = json.load(f)
 
-        # Normalise to list of dicts
-        entries = []
-        for item in raw:
-            if isinstance(item, str):
-                entries.append({'name': item.strip(), 'career_url': None})
-            elif isinstance(item, dict):
-                entries.append({
-                    'name': (item.get('name') or '').strip(),
-                    'career_url': (item.get('career_url') or '').strip() or None,
-                })
-
-        if TargetCompany.query.count() == 0:
-            # First run – bulk insert
-            for entry in entries:
-                if entry['name']:
-                    db.session.add(TargetCompany(
-                        name=entry['name'],
-                        career_url=entry['career_url'],
-                        active=True,
-                    ))
-            db.session.commit()
-            logger.info(f"Seeded {len(entries)} target companies")
+        existing = {c.name.lower(): c for c in TargetCompany.query.all()}
+        new_rows = {}
+        updated = 0
+        for entry in _iter_company_entries(raw):
+            key = entry['name'].lower()
+            if key in existing:
+                # Update career_url if the JSON has one and db doesn't (or changed)
+                if entry['career_url'] and existing[key].career_url != entry['career_url']:
+                    existing[key].career_url = entry['career_url']
+                    updated += 1
+            elif key not in new_rows:
+                new_rows[key] = {**entry, 'active': True}
+
+        if new_rows:
+            # Several gunicorn workers may seed at once – skip rows that
+            # another worker inserted first.
+            db.session.execute(
+                _insert_ignoring_conflicts(TargetCompany),
+                list(new_rows.values()),
+            )
+        db.session.commit()
+
+        if not existing:
+            logger.info(f"Seeded {len(new_rows)} target companies")
+        elif new_rows or updated:
+            logger.info(
+                f"Target companies sync: {len(new_rows)} added, "
+                f"{updated} career URLs updated"
+            )
+
+
+def _iter_company_entries(raw):
+    """Yield normalised {'name', 'career_url'} dicts, skipping blank names."""
+    for item in raw:
+        if isinstance(item, str):
+            name, career_url = item.strip(), None
+        elif isinstance(item, dict):
+            name = (item.get('name') or '').strip()
+            career_url = (item.get('career_url') or '').strip() or None
         else:
-            # Subsequent run – upsert career URLs + add new companies
-            existing = {c.name.lower(): c for c in TargetCompany.query.all()}
-            added = 0
-            updated = 0
-            for entry in entries:
-                if not entry['name']:
-                    continue
-                key = entry['name'].lower()
-                if key in existing:
-                    # Update career_url if the JSON has one and db doesn't (or changed)
-                    if entry['career_url'] and existing[key].career_url != entry['career_url']:
-                        existing[key].career_url = entry['career_url']
-                        updated += 1
-                else:
-                    db.session.add(TargetCompany(
-                        name=entry['name'],
-                        career_url=entry['career_url'],
-                        active=True,
-                    ))
-                    added += 1
-            db.session.commit()
-            if added or updated:
-                logger.info(
-                    f"Target companies sync: {added} added, {updated} career URLs updated"
-                )
+            continue
+        if name:
+            yield {'name': name, 'career_url': career_url}
+
+
+def _insert_ignoring_conflicts(model):
+    """INSERT statement that skips rows violating a unique constraint."""
+    dialect = db.engine.dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return db.insert(model)
+    return insert(model).on_conflict_do_nothing()
 
 
 # ── Scheduler ────────────────────────────────────────────────────
 def _start_scheduler(app: Flask):
-    """Set up APScheduler for the daily scrape job."""
+    """Set up APScheduler for the daily scrape job (local development only).
+
+    Production deployments trigger ``POST /internal/scrape`` from a single
+    external timer instead (see ``deploy/``), so gunicorn workers don't
+    each run their own scrape.
+    """
+    from apscheduler.schedulers.background import BackgroundScheduler
+
     scheduler = BackgroundScheduler(daemon=True)
 
     def daily_scrape():
@@ -167,4 +320,5 @@ def _start_scheduler(app: Flask):
 app = create_app()
 
 if __name__ == '__main__':
+    _start_scheduler(app)
     app.run(debug=True, host='0.0.0.0', port=5050, use_reloader=False)
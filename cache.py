@@ -0,0 +1,29 @@
+"""In-process TTL cache for API payloads that only change with a scrape."""
+import threading
+import time
+
+_CACHE = {}
+_LOCK = threading.Lock()
+# Stats are keyed per date range; start over rather than grow unbounded
+_MAX_ENTRIES = 256
+
+
+def cached(key, ttl, build):
+    """Return the payload cached under *key*, calling *build()* on a miss."""
+    now = time.monotonic()
+    hit = _CACHE.get(key)
+    if hit and hit[0] > now:
+        return hit[1]
+
+    payload = build()
+    with _LOCK:
+        if len(_CACHE) >= _MAX_ENTRIES:
+            _CACHE.clear()
+        _CACHE[key] = (now + ttl, payload)
+    return payload
+
+
+def clear():
+    """Drop every cached payload – called when a scrape run starts or ends."""
+    with _LOCK:
+        _CACHE.clear()
@@ -11,17 +11,33 @@ class Config:
         f'sqlite:///{os.path.join(BASE_DIR, "data", "jobs.db")}'
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    IS_SQLITE = SQLALCHEMY_DATABASE_URI.startswith('sqlite')
+
+    # Applied to every new SQLite connection: WAL lets the API read while
+    # the scraper writes, and NORMAL sync skips the fsync on each commit.
+    SQLITE_PRAGMAS = (
+        'journal_mode=WAL',
+        'synchronous=NORMAL',
+        'cache_size=-20000',
+        'temp_store=MEMORY',
+        'mmap_size=268435456',
+        'busy_timeout=5000',
+    )
     SECRET_KEY = os.environ.get('SECRET_KEY', 'uk-job-scraper-dev-key-change-in-production')
 
     # Scraper schedule (24-hour format)
     SCRAPE_HOUR = int(os.environ.get('SCRAPE_HOUR', '6'))
     SCRAPE_MINUTE = int(os.environ.get('SCRAPE_MINUTE', '0'))
+    # Shared secret for POST /internal/scrape; the endpoint is disabled if unset
+    SCRAPE_TOKEN = os.environ.get('SCRAPE_TOKEN', '')
 
     # Scraper behavior
     REQUEST_DELAY_MIN = float(os.environ.get('REQUEST_DELAY_MIN', '1.5'))
     REQUEST_DELAY_MAX = float(os.environ.get('REQUEST_DELAY_MAX', '4.0'))
     MAX_PAGES_PER_SOURCE = int(os.environ.get('MAX_PAGES_PER_SOURCE', '10'))
     MAX_RESULTS_PER_COMPANY = int(os.environ.get('MAX_RESULTS_PER_COMPANY', '50'))
+    # Career pages fetched concurrently (requests to one host stay serial)
+    CAREER_WORKERS = int(os.environ.get('CAREER_WORKERS', '8'))
 
     # API Keys (optional – enables additional sources)
     ADZUNA_APP_ID = os.environ.get('ADZUNA_APP_ID', '')
@@ -31,6 +47,12 @@ class Config:
     # Data paths
     TARGET_COMPANIES_FILE = os.path.join(BASE_DIR, 'data', 'target_companies.json')
     LOG_DIR = os.path.join(BASE_DIR, 'logs')
+    # Gzipped per-day JSON exports written after each scrape run
+    DAILY_JSON_DIR = os.path.join(BASE_DIR, 'data', 'daily')
+    # Web-search result pages reused by runs within SEARCH_CACHE_TTL
+    # seconds (e.g. a manual scrape after the scheduled one); 0 disables
+    SEARCH_CACHE_DIR = os.path.join(BASE_DIR, 'data', 'search_cache')
+    SEARCH_CACHE_TTL = int(os.environ.get('SEARCH_CACHE_TTL', str(6 * 3600)))
 
     # Pagination
     DEFAULT_PAGE_SIZE = 50
@@ -18,15 +18,22 @@ class Job(db.Model):
     job_type = db.Column(db.String(100), nullable=True)
     salary = db.Column(db.String(200), nullable=True)
     url = db.Column(db.String(2000), nullable=False)
-    url_hash = db.Column(db.String(64), nullable=False, index=True)
+    url_hash = db.Column(db.LargeBinary(16), nullable=False)
     source = db.Column(db.String(100), nullable=False)
-    scrape_date = db.Column(db.Date, nullable=False, index=True)
+    scrape_date = db.Column(db.Date, nullable=False)
     first_seen_date = db.Column(db.Date, nullable=False)
     last_seen_date = db.Column(db.Date, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # url_hash and scrape_date need no single-column indexes: the unique
+    # (url_hash, scrape_date) index serves the engine's per-URL lookups,
+    # latest-date-first included, and scrape_date leads the other two.
     __table_args__ = (
         db.UniqueConstraint('url_hash', 'scrape_date', name='uq_job_url_date'),
+        db.Index('ix_jobs_scrape_date_id', 'scrape_date', 'id'),
+        # Covers date-range filters with source, plus the stats aggregates
+        db.Index('ix_jobs_scrape_date_source_company',
+                 'scrape_date', 'source', 'company'),
     )
 
     def to_dict(self):
@@ -59,6 +66,15 @@ class Job(db.Model):
         }
 
 
+# Same-day duplicate check on title + company regardless of URL (tracking
+# redirects give one listing several URLs); expressions can't go in
+# __table_args__, so the index is declared against the mapped columns.
+db.Index(
+    'ix_jobs_title_company_ci',
+    db.func.lower(Job.title), db.func.lower(Job.company), Job.scrape_date,
+)
+
+
 class TargetCompany(db.Model):
     """Priority company for scraping."""
     __tablename__ = 'target_companies'
@@ -14,18 +14,20 @@ import os
 import csv
 import io
 import base64
+import re
+import time
+from collections import OrderedDict
 from datetime import date, datetime, timedelta
 
-from sqlalchemy import (
-    create_engine, Column, Integer, String, Date, DateTime,
-    Boolean, Text, UniqueConstraint, or_, func,
-)
-from sqlalchemy.orm import declarative_base, sessionmaker
+import orjson
 
 
 # ═══════════════════════════════════════════════════════════════════
 # DATABASE SETUP
 # ═══════════════════════════════════════════════════════════════════
+# SQLAlchemy is imported on first database use rather than at module
+# scope, so cold starts that only answer CORS preflights or 404s never
+# pay for it.  _lazy_db() fills in the globals below.
 
 DATABASE_URL = os.environ.get('DATABASE_URL', 'sqlite:////tmp/jobs.db')
 
@@ -33,59 +35,188 @@ DATABASE_URL = os.environ.get('DATABASE_URL', 'sqlite:////tmp/jobs.db')
 if DATABASE_URL.startswith('postgres://'):
     DATABASE_URL = DATABASE_URL.replace('postgres://', 'postgresql://', 1)
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, pool_recycle=300)
-SessionLocal = sessionmaker(bind=engine)
-Base = declarative_base()
-
-
-# ── ORM Models ───────────────────────────────────────────────────
-
-class Job(Base):
-    __tablename__ = 'jobs'
-
-    id = Column(Integer, primary_key=True)
-    title = Column(String(500), nullable=False)
-    company = Column(String(300), nullable=False)
-    location = Column(String(300), nullable=False)
-    category = Column(String(200), nullable=True)
-    experience_level = Column(String(100), nullable=True)
-    job_type = Column(String(100), nullable=True)
-    salary = Column(String(200), nullable=True)
-    url = Column(String(2000), nullable=False)
-    url_hash = Column(String(64), nullable=False, index=True)
-    source = Column(String(100), nullable=False)
-    scrape_date = Column(Date, nullable=False, index=True)
-    first_seen_date = Column(Date, nullable=False)
-    last_seen_date = Column(Date, nullable=False)
-    created_at = Column(DateTime)
-
-    __table_args__ = (
-        UniqueConstraint('url_hash', 'scrape_date', name='uq_job_url_date'),
-    )
+_IS_SQLITE = DATABASE_URL.startswith('sqlite')
+
+_SQLITE_PRAGMAS = (
+    'journal_mode=WAL',
+    'synchronous=NORMAL',
+    'cache_size=-20000',
+    'temp_store=MEMORY',
+    'mmap_size=268435456',
+    'busy_timeout=5000',
+)
+
+# Handlers only read; a small fixed pool per warm container is plenty
+_READ_POOL_SIZE = os.cpu_count() or 2
 
+# Room for every filter/sort combination of the hot handlers, so warm
+# invocations reuse compiled SQL instead of recompiling it
+_QUERY_CACHE_SIZE = 2000
+
+# Dashboard lookups with a fixed shape go straight to the driver,
+# skipping SQL compilation and ORM row processing altogether.
+_DATES_SQL = (
+    'SELECT scrape_date, COUNT(*) FROM jobs '
+    'GROUP BY scrape_date ORDER BY scrape_date DESC'
+)
+
+_COMPANIES_SQL = (
+    'SELECT id, name FROM target_companies WHERE active ORDER BY name'
+)
 
-class TargetCompany(Base):
-    __tablename__ = 'target_companies'
+write_engine = read_engine = None
+ReadSession = WriteSession = None
+Base = Job = TargetCompany = ScrapeRun = None
+or_ = func = select = tuple_ = None
+_jobs_fts = None
+_LAST_RUN_STMT = _EXPORT_COLUMNS = _JSON_EXPORT_COLUMNS = None
+
+_db_loaded = False
+
+
+def _sqlite_pragma_listener(pragmas):
+    def _set_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        for pragma in pragmas:
+            cursor.execute(f'PRAGMA {pragma}')
+        cursor.close()
+    return _set_pragmas
+
+
+def _lazy_db():
+    """Import SQLAlchemy and build the engines, models and statements."""
+    global _db_loaded, write_engine, read_engine, ReadSession, WriteSession
+    global Base, Job, TargetCompany, ScrapeRun, or_, func, select, tuple_
+    global _jobs_fts
+    global _LAST_RUN_STMT, _EXPORT_COLUMNS, _JSON_EXPORT_COLUMNS
+    if _db_loaded:
+        return
+
+    from sqlalchemy import (
+        create_engine, event, make_url,
+        Column, Integer, String, Date, DateTime,
+        Boolean, Text, LargeBinary, Index, UniqueConstraint,
+        or_, func, select, tuple_, table, column,
+    )
+    from sqlalchemy.orm import declarative_base, sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    if _IS_SQLITE:
+        # /tmp/jobs.db belongs to this one process – one writer connection
+        write_engine = create_engine(
+            DATABASE_URL,
+            connect_args={'check_same_thread': False},
+            poolclass=StaticPool,
+        )
+        # Readers open the same file read-only so they never take the write lock
+        read_engine = create_engine(
+            f'sqlite:///file:{make_url(DATABASE_URL).database}?mode=ro&uri=true',
+            connect_args={'check_same_thread': False},
+            pool_size=_READ_POOL_SIZE,
+            max_overflow=0,
+            query_cache_size=_QUERY_CACHE_SIZE,
+        )
+        event.listen(write_engine, 'connect',
+                     _sqlite_pragma_listener(_SQLITE_PRAGMAS))
+        # journal_mode is persistent and can only be set by the writer
+        event.listen(read_engine, 'connect',
+                     _sqlite_pragma_listener(_SQLITE_PRAGMAS[1:]))
+        # Refresh planner statistics; needs write access for sqlite_stat1
+        event.listen(write_engine, 'close',
+                     _sqlite_pragma_listener(('optimize',)))
+    else:
+        write_engine = create_engine(
+            DATABASE_URL,
+            pool_size=1, max_overflow=0,
+            pool_pre_ping=True, pool_recycle=300,
+        )
+        read_engine = create_engine(
+            DATABASE_URL,
+            pool_size=_READ_POOL_SIZE, max_overflow=0,
+            pool_pre_ping=True, pool_recycle=300,
+            query_cache_size=_QUERY_CACHE_SIZE,
+            execution_options={'postgresql_readonly': True},
+        )
 
-    id = Column(Integer, primary_key=True)
-    name = Column(String(300), nullable=False, unique=True)
-    career_url = Column(String(2000), nullable=True)
-    active = Column(Boolean, default=True)
+    ReadSession = sessionmaker(bind=read_engine)
+    WriteSession = sessionmaker(bind=write_engine)
+    Base = declarative_base()
+
+    # ── ORM Models ───────────────────────────────────────────────
+
+    class Job(Base):
+        __tablename__ = 'jobs'
+
+        id = Column(Integer, primary_key=True)
+        title = Column(String(500), nullable=False)
+        company = Column(String(300), nullable=False)
+        location = Column(String(300), nullable=False)
+        category = Column(String(200), nullable=True)
+        experience_level = Column(String(100), nullable=True)
+        job_type = Column(String(100), nullable=True)
+        salary = Column(String(200), nullable=True)
+        url = Column(String(2000), nullable=False)
+        url_hash = Column(LargeBinary(16), nullable=False)
+        source = Column(String(100), nullable=False)
+        scrape_date = Column(Date, nullable=False)
+        first_seen_date = Column(Date, nullable=False)
+        last_seen_date = Column(Date, nullable=False)
+        created_at = Column(DateTime)
+
+        __table_args__ = (
+            UniqueConstraint('url_hash', 'scrape_date', name='uq_job_url_date'),
+            Index('ix_jobs_scrape_date_id', 'scrape_date', 'id'),
+            # Covers date-range filters with source, plus the stats aggregates
+            Index('ix_jobs_scrape_date_source_company',
+                  'scrape_date', 'source', 'company'),
+        )
 
+    class TargetCompany(Base):
+        __tablename__ = 'target_companies'
+
+        id = Column(Integer, primary_key=True)
+        name = Column(String(300), nullable=False, unique=True)
+        career_url = Column(String(2000), nullable=True)
+        active = Column(Boolean, default=True)
+
+    class ScrapeRun(Base):
+        __tablename__ = 'scrape_runs'
+
+        id = Column(Integer, primary_key=True)
+        run_date = Column(Date, nullable=False)
+        status = Column(String(20), nullable=False, default='running')
+        jobs_found = Column(Integer, default=0)
+        new_jobs = Column(Integer, default=0)
+        duplicates = Column(Integer, default=0)
+        failed_sources = Column(Integer, default=0)
+        started_at = Column(DateTime)
+        completed_at = Column(DateTime, nullable=True)
+        log = Column(Text, nullable=True)
+
+    # FTS5 shadow table of jobs(title, company, location); see _init_search()
+    _jobs_fts = table('jobs_fts', column('rowid'), column('jobs_fts'))
+
+    # ── Constant statements ──────────────────────────────────────
+    # Built once per container; their compiled form stays in the engine cache.
+
+    _LAST_RUN_STMT = (
+        select(ScrapeRun)
+        .order_by(ScrapeRun.started_at.desc())
+        .limit(1)
+    )
 
-class ScrapeRun(Base):
-    __tablename__ = 'scrape_runs'
+    # Column order matches the CSV / Excel header row (after S/NO).
+    _EXPORT_COLUMNS = (
+        Job.company, Job.title, Job.url, Job.location,
+        Job.salary, Job.category, Job.experience_level, Job.job_type,
+        Job.source, Job.scrape_date,
+    )
+    _JSON_EXPORT_COLUMNS = (
+        Job.title, Job.company, Job.location, Job.category,
+        Job.experience_level, Job.job_type, Job.salary, Job.url,
+    )
 
-    id = Column(Integer, primary_key=True)
-    run_date = Column(Date, nullable=False)
-    status = Column(String(20), nullable=False, default='running')
-    jobs_found = Column(Integer, default=0)
-    new_jobs = Column(Integer, default=0)
-    duplicates = Column(Integer, default=0)
-    failed_sources = Column(Integer, default=0)
-    started_at = Column(DateTime)
-    completed_at = Column(DateTime, nullable=True)
-    log = Column(Text, nullable=True)
+    _db_loaded = True
 
 
 # ── DB helpers ───────────────────────────────────────────────────
@@ -96,13 +227,99 @@ _db_initialized = False
 def _init_db():
     global _db_initialized
     if not _db_initialized:
-        Base.metadata.create_all(bind=engine)
+        _lazy_db()
+        Base.metadata.create_all(bind=write_engine)
+        # create_all skips indexes on tables that already exist
+        for index in Job.__table__.indexes:
+            index.create(bind=write_engine, checkfirst=True)
+        _init_search()
         _db_initialized = True
 
 
-def _get_session():
+# ── Search index ─────────────────────────────────────────────────
+# Substring search over title/company/location.  A leading-wildcard
+# ILIKE can't use a B-tree, so SQLite gets an FTS5 trigram table (kept in
+# sync by triggers) and PostgreSQL gets pg_trgm GIN indexes, which serve
+# the existing ILIKE directly.
+
+_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5("
+    "title, company, location, content='jobs', content_rowid='id', "
+    "tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN "
+    "INSERT INTO jobs_fts(rowid, title, company, location) "
+    "VALUES (new.id, new.title, new.company, new.location); END",
+    "CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN "
+    "INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location) "
+    "VALUES ('delete', old.id, old.title, old.company, old.location); END",
+    "CREATE TRIGGER IF NOT EXISTS jobs_fts_au "
+    "AFTER UPDATE OF title, company, location ON jobs BEGIN "
+    "INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location) "
+    "VALUES ('delete', old.id, old.title, old.company, old.location); "
+    "INSERT INTO jobs_fts(rowid, title, company, location) "
+    "VALUES (new.id, new.title, new.company, new.location); END",
+)
+
+_TRGM_DDL = (
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE INDEX IF NOT EXISTS ix_jobs_title_trgm '
+    'ON jobs USING gin (title gin_trgm_ops)',
+    'CREATE INDEX IF NOT EXISTS ix_jobs_company_trgm '
+    'ON jobs USING gin (company gin_trgm_ops)',
+    'CREATE INDEX IF NOT EXISTS ix_jobs_location_trgm '
+    'ON jobs USING gin (location gin_trgm_ops)',
+)
+
+# Trigram matching needs at least three characters
+_FTS_MIN_TERM = 3
+
+_has_fts = False
+
+
+def _init_search():
+    global _has_fts
+    try:
+        with write_engine.begin() as conn:
+            if _IS_SQLITE:
+                exists = conn.exec_driver_sql(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'"
+                ).first()
+                for stmt in _FTS_DDL:
+                    conn.exec_driver_sql(stmt)
+                if not exists:
+                    conn.exec_driver_sql(
+                        "INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')"
+                    )
+                _has_fts = True
+            else:
+                for stmt in _TRGM_DDL:
+                    conn.exec_driver_sql(stmt)
+    except Exception as exc:
+        # Missing FTS5 build / extension privileges – plain ILIKE still works
+        print(f"[WARN] search index unavailable: {exc}")
+
+
+def _search_filter(search):
+    """WHERE clause matching *search* as a substring of title/company/location."""
+    if _has_fts and len(search) >= _FTS_MIN_TERM:
+        # A quoted string is matched as one phrase, i.e. a substring
+        phrase = '"' + search.replace('"', '""') + '"'
+        return Job.id.in_(
+            select(_jobs_fts.c.rowid)
+            .where(_jobs_fts.c.jobs_fts.op('MATCH')(phrase))
+        )
+
+    term = f'%{search}%'
+    return or_(
+        Job.title.ilike(term),
+        Job.company.ilike(term),
+        Job.location.ilike(term),
+    )
+
+
+def _get_read_session():
     _init_db()
-    return SessionLocal()
+    return ReadSession()
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -120,49 +337,17 @@ def handler(event, context):
     method = event.get('httpMethod', 'GET')
     params = event.get('queryStringParameters') or {}
 
-    # Normalise route: strip function path and /api/ prefix
-    route = path
-    for prefix in ['/.netlify/functions/api', '/api']:
-        if route.startswith(prefix):
-            route = route[len(prefix):]
-            break
-    route = route.strip('/')
-
     try:
         # ── Route dispatch ──────────────────────────────────────
-        if route == 'jobs' and method == 'GET':
-            return _get_jobs(params)
-
-        elif route == 'jobs/export/csv':
-            return _export_csv(params)
-
-        elif route == 'jobs/export/excel':
-            return _export_excel(params)
-
-        elif route == 'jobs/export/json':
-            return _export_json_range(params)
+        for pattern, route_method, route_fn in _ROUTES:
+            if route_method and route_method != method:
+                continue
+            m = pattern.match(path)
+            if m:
+                return route_fn(params, *m.groups())
 
-        elif route.startswith('jobs/daily-json/'):
-            date_str = route.split('/')[-1]
-            return _daily_json(date_str)
-
-        elif route == 'stats':
-            return _get_stats(params)
-
-        elif route == 'dates':
-            return _get_dates()
-
-        elif route == 'companies':
-            return _get_companies()
-
-        elif route == 'scrape' and method == 'POST':
-            return _scrape_unavailable()
-
-        elif route == 'scrape/status':
-            return _get_scrape_status()
-
-        else:
-            return _json_response(404, {'error': f'Not found: /api/{route}'})
+        route = _ROUTE_PREFIX_RE.sub('', path).strip('/')
+        return _json_response(404, {'error': f'Not found: /api/{route}'})
 
     except Exception as exc:
         print(f"[ERROR] {method} {path}: {exc}")
@@ -184,23 +369,61 @@ def _cors_response():
     return {'statusCode': 204, 'headers': _CORS_HEADERS, 'body': ''}
 
 
+_JSON_HEADERS = {**_CORS_HEADERS, 'Content-Type': 'application/json'}
+
+
 def _json_response(status, body):
+    # orjson writes date/datetime values as ISO-8601 itself
     return {
         'statusCode': status,
-        'headers': {**_CORS_HEADERS, 'Content-Type': 'application/json'},
-        'body': json.dumps(body, default=str),
+        'headers': _JSON_HEADERS,
+        'body': orjson.dumps(body, default=str).decode('utf-8'),
     }
 
 
-def _file_response(body_bytes, content_type, filename):
+# Dates and companies only change with the daily scrape, but every UI
+# page load asks for them.  Warm containers reuse the serialised response
+# until the TTL lapses.
+_RESPONSE_CACHE = {}
+_DATES_CACHE_TTL = 300      # seconds
+_COMPANIES_CACHE_TTL = 600  # seconds
+
+
+def _cached_response(key, ttl, build):
+    now = time.monotonic()
+    hit = _RESPONSE_CACHE.get(key)
+    if hit and hit[0] > now:
+        return hit[1]
+
+    response = build()
+    if response['statusCode'] == 200:
+        _RESPONSE_CACHE[key] = (now + ttl, response)
+    return response
+
+
+_CSV_HEADERS = {**_CORS_HEADERS, 'Content-Type': 'text/csv'}
+_XLSX_HEADERS = {
+    **_CORS_HEADERS,
+    'Content-Type':
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+
+def _file_response(buf, headers, filename):
+    """Base64 response for the bytes in *buf* (a BytesIO).
+
+    Encodes straight from the buffer's memoryview, skipping the extra
+    copy ``getvalue()`` would make.
+    """
+    with buf.getbuffer() as view:
+        body = base64.b64encode(view).decode('ascii')
     return {
         'statusCode': 200,
         'headers': {
-            **_CORS_HEADERS,
-            'Content-Type': content_type,
+            **headers,
             'Content-Disposition': f'attachment; filename={filename}',
         },
-        'body': base64.b64encode(body_bytes).decode('utf-8'),
+        'body': body,
         'isBase64Encoded': True,
     }
 
@@ -222,9 +445,37 @@ def _parse_date(val, default=None):
 # SHARED QUERY BUILDER
 # ═══════════════════════════════════════════════════════════════════
 
-def _build_filtered_query(session, params):
-    """Build a filtered + sorted Job query from request params."""
-    query = session.query(Job)
+# Export column tuples are built alongside the models in _lazy_db().
+_EXPORT_HEADERS = [
+    'S/NO', 'Company Name', 'Job Title', 'Job Link', 'Location',
+    'Salary', 'Category', 'Experience Level', 'Job Type',
+    'Source', 'Scrape Date',
+]
+# Fixed widths – auto-fitting would need every cell held in memory
+_EXPORT_COL_WIDTHS = (8, 30, 45, 50, 25, 20, 22, 18, 18, 15, 13)
+_EXPORT_CHUNK_SIZE = 5000
+
+
+def _sort_spec(params):
+    """Return ``(column, descending)`` for the requested sort."""
+    sort_map = {
+        'scrape_date': Job.scrape_date,
+        'company': Job.company,
+        'title': Job.title,
+        'location': Job.location,
+        'source': Job.source,
+    }
+    col = sort_map.get(params.get('sort_by', 'scrape_date'), Job.scrape_date)
+    return col, params.get('sort_order', 'desc') != 'asc'
+
+
+def _build_filtered_query(session, params, columns=None):
+    """Build a filtered + sorted Job query from request params.
+
+    When *columns* is given the query selects only those columns and
+    yields plain row tuples instead of ORM instances.
+    """
+    query = session.query(*columns) if columns else session.query(Job)
 
     date_from = _parse_date(params.get('date_from'), date.today() - timedelta(days=7))
     date_to = _parse_date(params.get('date_to'), date.today())
@@ -232,32 +483,64 @@ def _build_filtered_query(session, params):
 
     search = (params.get('search') or '').strip()
     if search:
-        term = f'%{search}%'
-        query = query.filter(or_(
-            Job.title.ilike(term),
-            Job.company.ilike(term),
-            Job.location.ilike(term),
-        ))
+        query = query.filter(_search_filter(search))
 
     source = (params.get('source') or '').strip()
     if source:
         query = query.filter(Job.source == source)
 
-    sort_by = params.get('sort_by', 'scrape_date')
-    sort_order = params.get('sort_order', 'desc')
-    sort_map = {
-        'scrape_date': Job.scrape_date,
-        'company': Job.company,
-        'title': Job.title,
-        'location': Job.location,
-        'source': Job.source,
-    }
-    col = sort_map.get(sort_by, Job.scrape_date)
-    query = query.order_by(col.asc() if sort_order == 'asc' else col.desc())
+    col, descending = _sort_spec(params)
+    # id breaks ties so OFFSET pages and keyset cursors are deterministic
+    if descending:
+        query = query.order_by(col.desc(), Job.id.desc())
+    else:
+        query = query.order_by(col.asc(), Job.id.asc())
 
     return query
 
 
+# ── Pagination helpers ──────────────────────────────────────────
+
+_FILTER_PARAMS = ('date_from', 'date_to', 'search', 'source')
+_COUNT_CACHE = OrderedDict()
+_COUNT_CACHE_SIZE = 128
+_COUNT_CACHE_TTL = 60  # seconds
+
+
+def _cached_count(query, params):
+    """COUNT(*) for the filtered query, memoised per filter set for 60 s."""
+    key = (date.today(),) + tuple(params.get(k) for k in _FILTER_PARAMS)
+    now = time.monotonic()
+
+    hit = _COUNT_CACHE.get(key)
+    if hit and now - hit[0] < _COUNT_CACHE_TTL:
+        _COUNT_CACHE.move_to_end(key)
+        return hit[1]
+
+    total = query.order_by(None).count()
+    _COUNT_CACHE[key] = (now, total)
+    _COUNT_CACHE.move_to_end(key)
+    if len(_COUNT_CACHE) > _COUNT_CACHE_SIZE:
+        _COUNT_CACHE.popitem(last=False)
+    return total
+
+
+def _encode_cursor(job, sort_col):
+    value = getattr(job, sort_col.key)
+    if isinstance(value, date):
+        value = value.isoformat()
+    raw = json.dumps([value, job.id]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+
+def _decode_cursor(cursor, sort_col):
+    """Return ``(sort_value, id)``; raises ValueError on a malformed cursor."""
+    value, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    if sort_col is Job.scrape_date:
+        value = datetime.strptime(value, '%Y-%m-%d').date()
+    return value, int(job_id)
+
+
 # ═══════════════════════════════════════════════════════════════════
 # MODEL SERIALIZERS
 # ═══════════════════════════════════════════════════════════════════
@@ -274,12 +557,30 @@ def _job_dict(j):
         'salary': j.salary,
         'url': j.url,
         'source': j.source,
-        'scrape_date': j.scrape_date.isoformat() if j.scrape_date else None,
-        'first_seen_date': j.first_seen_date.isoformat() if j.first_seen_date else None,
-        'last_seen_date': j.last_seen_date.isoformat() if j.last_seen_date else None,
+        # Left as date objects – _json_response serialises them natively
+        'scrape_date': j.scrape_date,
+        'first_seen_date': j.first_seen_date,
+        'last_seen_date': j.last_seen_date,
     }
 
 
+def _json_array(records):
+    """Serialise *records* one at a time into an indented JSON array.
+
+    Avoids building the full list of dicts (and one huge intermediate
+    string) before encoding.
+    """
+    buf = io.BytesIO()
+    buf.write(b'[')
+    sep = b'\n'
+    for record in records:
+        buf.write(sep)
+        buf.write(orjson.dumps(record, option=orjson.OPT_INDENT_2))
+        sep = b',\n'
+    buf.write(b'\n]' if sep != b'\n' else b']')
+    return buf.getvalue().decode('utf-8')
+
+
 def _job_export(j):
     return {
         'title': j.title,
@@ -300,16 +601,50 @@ def _job_export(j):
 # ── GET /api/jobs ────────────────────────────────────────────────
 
 def _get_jobs(params):
-    session = _get_session()
+    """Paginated job list.
+
+    Pass ``cursor`` (the previous response's ``next_cursor``) for keyset
+    pagination, which skips the COUNT(*) unless ``with_total=1``.  The
+    ``page`` parameter keeps working via OFFSET with a cached total.
+    """
+    session = _get_read_session()
     try:
         query = _build_filtered_query(session, params)
+        sort_col, descending = _sort_spec(params)
+        page_size = min(int(params.get('page_size', 50)), 200)
+
+        cursor = params.get('cursor')
+        if cursor:
+            try:
+                value, last_id = _decode_cursor(cursor, sort_col)
+            except (ValueError, TypeError):
+                return _json_response(400, {'error': 'Invalid cursor.'})
+
+            key = tuple_(sort_col, Job.id)
+            bound = tuple_(value, last_id)
+            page_query = query.filter(key < bound if descending else key > bound)
+
+            jobs = page_query.limit(page_size + 1).all()
+            has_next = len(jobs) > page_size
+            jobs = jobs[:page_size]
+
+            body = {
+                'jobs': [_job_dict(j) for j in jobs],
+                'page_size': page_size,
+                'has_next': has_next,
+                'next_cursor': (_encode_cursor(jobs[-1], sort_col)
+                                if has_next else None),
+            }
+            if params.get('with_total') == '1':
+                body['total'] = _cached_count(query, params)
+            return _json_response(200, body)
 
         page = max(1, int(params.get('page', 1)))
-        page_size = min(int(params.get('page_size', 50)), 200)
-        total = query.count()
+        total = _cached_count(query, params)
         total_pages = max(1, (total + page_size - 1) // page_size)
 
         jobs = query.offset((page - 1) * page_size).limit(page_size).all()
+        has_next = page < total_pages
 
         return _json_response(200, {
             'jobs': [_job_dict(j) for j in jobs],
@@ -317,8 +652,10 @@ def _get_jobs(params):
             'page': page,
             'page_size': page_size,
             'total_pages': total_pages,
-            'has_next': page < total_pages,
+            'has_next': has_next,
             'has_prev': page > 1,
+            'next_cursor': (_encode_cursor(jobs[-1], sort_col)
+                            if has_next and jobs else None),
         })
     finally:
         session.close()
@@ -327,29 +664,26 @@ def _get_jobs(params):
 # ── GET /api/jobs/export/csv ─────────────────────────────────────
 
 def _export_csv(params):
-    session = _get_session()
+    session = _get_read_session()
     try:
-        jobs = _build_filtered_query(session, params).all()
-
-        buf = io.StringIO()
-        writer = csv.writer(buf)
-        writer.writerow([
-            'S/NO', 'Company Name', 'Job Title', 'Job Link', 'Location',
-            'Salary', 'Category', 'Experience Level', 'Job Type',
-            'Source', 'Scrape Date',
-        ])
-        for idx, j in enumerate(jobs, 1):
-            writer.writerow([
-                idx, j.company, j.title, j.url, j.location,
-                j.salary or '', j.category or '', j.experience_level or '',
-                j.job_type or '', j.source,
-                j.scrape_date.isoformat() if j.scrape_date else '',
-            ])
+        rows = (
+            _build_filtered_query(session, params, _EXPORT_COLUMNS)
+            .yield_per(_EXPORT_CHUNK_SIZE)
+        )
+
+        # csv writes None as '' and dates via str() (== isoformat), so
+        # row tuples can be handed to the C writer unchanged.  Text is
+        # encoded into the byte buffer as it is written.
+        buf = io.BytesIO()
+        text = io.TextIOWrapper(buf, encoding='utf-8', newline='',
+                                write_through=True)
+        writer = csv.writer(text)
+        writer.writerow(_EXPORT_HEADERS)
+        writer.writerows((idx, *row) for idx, row in enumerate(rows, 1))
+        text.detach()
 
         return _file_response(
-            buf.getvalue().encode('utf-8'),
-            'text/csv',
-            f'uk_jobs_{date.today().isoformat()}.csv',
+            buf, _CSV_HEADERS, f'uk_jobs_{date.today().isoformat()}.csv',
         )
     finally:
         session.close()
@@ -358,58 +692,45 @@ def _export_csv(params):
 # ── GET /api/jobs/export/excel ───────────────────────────────────
 
 def _export_excel(params):
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment
+    from xlsxwriter import Workbook
 
-    session = _get_session()
+    session = _get_read_session()
     try:
-        jobs = _build_filtered_query(session, params).all()
-
-        wb = Workbook()
-        ws = wb.active
-        ws.title = 'UK Jobs'
-
-        headers = [
-            'S/NO', 'Company Name', 'Job Title', 'Job Link', 'Location',
-            'Salary', 'Category', 'Experience Level', 'Job Type',
-            'Source', 'Scrape Date',
-        ]
-        ws.append(headers)
-
-        hfont = Font(bold=True, color='FFFFFF')
-        hfill = PatternFill(start_color='1a73e8', end_color='1a73e8',
-                            fill_type='solid')
-        for cell in ws[1]:
-            cell.font = hfont
-            cell.fill = hfill
-            cell.alignment = Alignment(horizontal='center')
-
-        for idx, j in enumerate(jobs, 1):
-            ws.append([
-                idx, j.company, j.title, j.url, j.location,
-                j.salary or '', j.category or '', j.experience_level or '',
-                j.job_type or '', j.source,
-                j.scrape_date.isoformat() if j.scrape_date else '',
-            ])
-
-        for col_cells in ws.columns:
-            max_len = 0
-            letter = col_cells[0].column_letter
-            for cell in col_cells:
-                try:
-                    if len(str(cell.value)) > max_len:
-                        max_len = len(str(cell.value))
-                except TypeError:
-                    pass
-            ws.column_dimensions[letter].width = min(max_len + 2, 50)
+        rows = (
+            _build_filtered_query(session, params, _EXPORT_COLUMNS)
+            .yield_per(_EXPORT_CHUNK_SIZE)
+        )
 
+        # constant_memory flushes each row to a temp file once the next
+        # row starts, so memory stays flat regardless of export size.
         buf = io.BytesIO()
-        wb.save(buf)
+        wb = Workbook(buf, {
+            'constant_memory': True,
+            'strings_to_urls': False,
+            'strings_to_formulas': False,
+        })
+        ws = wb.add_worksheet('UK Jobs')
+
+        for col, width in enumerate(_EXPORT_COL_WIDTHS):
+            ws.set_column(col, col, width)
+
+        header_fmt = wb.add_format({
+            'bold': True, 'font_color': 'white',
+            'bg_color': '#1a73e8', 'align': 'center',
+        })
+        ws.write_row(0, 0, _EXPORT_HEADERS, header_fmt)
+
+        for idx, row in enumerate(rows, 1):
+            scrape_date = row[-1]
+            ws.write_row(idx, 0, (
+                idx, *row[:-1],
+                scrape_date.isoformat() if scrape_date else '',
+            ))
+
+        wb.close()
 
         return _file_response(
-            buf.getvalue(),
-            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            f'uk_jobs_{date.today().isoformat()}.xlsx',
+            buf, _XLSX_HEADERS, f'uk_jobs_{date.today().isoformat()}.xlsx',
         )
     finally:
         session.close()
@@ -430,22 +751,21 @@ def _export_json_range(params):
             'error': 'date_from must be on or before date_to.',
         })
 
-    session = _get_session()
+    session = _get_read_session()
     try:
-        jobs = (
-            session.query(Job)
+        rows = (
+            session.query(*_JSON_EXPORT_COLUMNS)
             .filter(Job.scrape_date >= date_from, Job.scrape_date <= date_to)
             .order_by(Job.scrape_date.desc(), Job.company)
-            .all()
+            .yield_per(_EXPORT_CHUNK_SIZE)
         )
-        data = json.dumps([_job_export(j) for j in jobs], indent=2)
+        data = _json_array(_job_export(r) for r in rows)
         fname = f'jobs_{date_from.isoformat()}_to_{date_to.isoformat()}.json'
 
         return {
             'statusCode': 200,
             'headers': {
-                **_CORS_HEADERS,
-                'Content-Type': 'application/json',
+                **_JSON_HEADERS,
                 'Content-Disposition': f'attachment; filename={fname}',
             },
             'body': data,
@@ -456,23 +776,26 @@ def _export_json_range(params):
 
 # ── GET /api/jobs/daily-json/<date> ──────────────────────────────
 
-def _daily_json(date_str):
+def _daily_json(params, date_str):
     target = _parse_date(date_str)
     if not target:
         return _json_response(400, {
             'error': 'Invalid date format. Use YYYY-MM-DD',
         })
 
-    session = _get_session()
+    session = _get_read_session()
     try:
-        jobs = session.query(Job).filter_by(scrape_date=target).all()
-        data = json.dumps([_job_export(j) for j in jobs], indent=2)
+        rows = (
+            session.query(*_JSON_EXPORT_COLUMNS)
+            .filter_by(scrape_date=target)
+            .yield_per(_EXPORT_CHUNK_SIZE)
+        )
+        data = _json_array(_job_export(r) for r in rows)
 
         return {
             'statusCode': 200,
             'headers': {
-                **_CORS_HEADERS,
-                'Content-Type': 'application/json',
+                **_JSON_HEADERS,
                 'Content-Disposition': f'attachment; filename=jobs_{date_str}.json',
             },
             'body': data,
@@ -489,32 +812,25 @@ def _get_stats(params):
     )
     date_to = _parse_date(params.get('date_to'), date.today())
 
-    session = _get_session()
+    session = _get_read_session()
     try:
-        total_jobs = (
-            session.query(func.count(Job.id))
-            .filter(Job.scrape_date >= date_from, Job.scrape_date <= date_to)
-            .scalar()
-        )
+        in_range = (Job.scrape_date >= date_from, Job.scrape_date <= date_to)
 
-        unique_companies = (
-            session.query(func.count(func.distinct(Job.company)))
-            .filter(Job.scrape_date >= date_from, Job.scrape_date <= date_to)
-            .scalar()
+        # Both totals come from a single scan of the date range
+        total_jobs, unique_companies = (
+            session.query(func.count(Job.id), func.count(func.distinct(Job.company)))
+            .filter(*in_range)
+            .one()
         )
 
         sources = (
             session.query(Job.source, func.count(Job.id))
-            .filter(Job.scrape_date >= date_from, Job.scrape_date <= date_to)
+            .filter(*in_range)
             .group_by(Job.source)
             .all()
         )
 
-        last_run = (
-            session.query(ScrapeRun)
-            .order_by(ScrapeRun.started_at.desc())
-            .first()
-        )
+        last_run = session.execute(_LAST_RUN_STMT).scalar()
 
         return _json_response(200, {
             'total_jobs': total_jobs or 0,
@@ -537,45 +853,39 @@ def _get_stats(params):
 
 # ── GET /api/dates ───────────────────────────────────────────────
 
-def _get_dates():
-    session = _get_session()
-    try:
-        rows = (
-            session.query(Job.scrape_date, func.count(Job.id))
-            .group_by(Job.scrape_date)
-            .order_by(Job.scrape_date.desc())
-            .all()
-        )
-        return _json_response(200, {
-            'dates': [
-                {'date': d.isoformat(), 'count': c} for d, c in rows
-            ],
-        })
-    finally:
-        session.close()
+def _get_dates(params):
+    return _cached_response('dates', _DATES_CACHE_TTL, _load_dates)
+
+
+def _load_dates():
+    _init_db()
+    with read_engine.connect() as conn:
+        rows = conn.exec_driver_sql(_DATES_SQL).fetchall()
+    # SQLite hands back ISO strings, PostgreSQL date objects – orjson
+    # renders both the same
+    return _json_response(200, {
+        'dates': [{'date': d, 'count': c} for d, c in rows],
+    })
 
 
 # ── GET /api/companies ───────────────────────────────────────────
 
-def _get_companies():
-    session = _get_session()
-    try:
-        rows = (
-            session.query(TargetCompany)
-            .filter_by(active=True)
-            .order_by(TargetCompany.name)
-            .all()
-        )
-        return _json_response(200, {
-            'companies': [{'id': c.id, 'name': c.name} for c in rows],
-        })
-    finally:
-        session.close()
+def _get_companies(params):
+    return _cached_response('companies', _COMPANIES_CACHE_TTL, _load_companies)
+
+
+def _load_companies():
+    _init_db()
+    with read_engine.connect() as conn:
+        rows = conn.exec_driver_sql(_COMPANIES_SQL).fetchall()
+    return _json_response(200, {
+        'companies': [{'id': i, 'name': n} for i, n in rows],
+    })
 
 
 # ── POST /api/scrape ─────────────────────────────────────────────
 
-def _scrape_unavailable():
+def _scrape_unavailable(params):
     return _json_response(200, {
         'status': 'unavailable',
         'error': (
@@ -588,14 +898,10 @@ def _scrape_unavailable():
 
 # ── GET /api/scrape/status ───────────────────────────────────────
 
-def _get_scrape_status():
-    session = _get_session()
+def _get_scrape_status(params):
+    session = _get_read_session()
     try:
-        last_run = (
-            session.query(ScrapeRun)
-            .order_by(ScrapeRun.started_at.desc())
-            .first()
-        )
+        last_run = session.execute(_LAST_RUN_STMT).scalar()
         if not last_run:
             return _json_response(200, {'status': 'no_runs'})
 
@@ -614,3 +920,32 @@ def _get_scrape_status():
         })
     finally:
         session.close()
+
+
+# ═══════════════════════════════════════════════════════════════════
+# ROUTE TABLE
+# ═══════════════════════════════════════════════════════════════════
+# Each pattern matches the full request path (with or without the
+# function / /api prefix) and captures any path parameters, which are
+# passed to the handler after ``params``.  A method of None accepts any.
+
+_ROUTE_PREFIX = r'(?:/\.netlify/functions/api|/api)?'
+_ROUTE_PREFIX_RE = re.compile('^' + _ROUTE_PREFIX)
+
+
+def _route(pattern):
+    return re.compile(f'^{_ROUTE_PREFIX}/*{pattern}/*$')
+
+
+_ROUTES = [
+    (_route(r'jobs'), 'GET', _get_jobs),
+    (_route(r'jobs/export/csv'), None, _export_csv),
+    (_route(r'jobs/export/excel'), None, _export_excel),
+    (_route(r'jobs/export/json'), None, _export_json_range),
+    (_route(r'jobs/daily-json/([^/]+)'), None, _daily_json),
+    (_route(r'stats'), None, _get_stats),
+    (_route(r'dates'), None, _get_dates),
+    (_route(r'companies'), None, _get_companies),
+    (_route(r'scrape'), 'POST', _scrape_unavailable),
+    (_route(r'scrape/status'), None, _get_scrape_status),
+]
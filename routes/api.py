@@ -1,14 +1,24 @@
 """REST API endpoints for the jobs portal."""
 import csv
+import gzip
 import io
 import json
+import os
 from datetime import date, datetime, timedelta
 
-from flask import Blueprint, request, jsonify, Response, send_file
+from flask import (
+    Blueprint, current_app, request, jsonify, Response, send_file,
+    stream_with_context,
+)
 from models import db, Job, ScrapeRun, TargetCompany
+import cache
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+# Dashboard payloads only change when a scrape runs (which clears the
+# cache); the TTL bounds staleness in workers that didn't run it.
+_STATS_CACHE_TTL = 900  # seconds
+
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
@@ -37,13 +47,20 @@ def _build_jobs_query():
     search = request.args.get('search', '').strip()
     if search:
         term = f'%{search}%'
-        query = query.filter(
-            db.or_(
-                Job.title.ilike(term),
-                Job.company.ilike(term),
-                Job.location.ilike(term),
+        matches = [
+            Job.title.ilike(term),
+            Job.company.ilike(term),
+            Job.location.ilike(term),
+        ]
+        if current_app.config.get('SEARCH_TSV'):
+            # Word match across all three fields; every branch of the OR
+            # is GIN-indexed, so PostgreSQL combines them in a bitmap scan
+            matches.append(
+                db.literal_column('jobs.search_tsv').op('@@')(
+                    db.func.plainto_tsquery('simple', search)
+                )
             )
-        )
+        query = query.filter(db.or_(*matches))
 
     # Company filter
     company = request.args.get('company', '').strip()
@@ -66,7 +83,11 @@ def _build_jobs_query():
         'source': Job.source,
     }
     sort_col = sort_columns.get(sort_by, Job.scrape_date)
-    query = query.order_by(sort_col.asc() if sort_order == 'asc' else sort_col.desc())
+    # id breaks ties so pages don't overlap or skip rows
+    if sort_order == 'asc':
+        query = query.order_by(sort_col.asc(), Job.id.asc())
+    else:
+        query = query.order_by(sort_col.desc(), Job.id.desc())
 
     return query
 
@@ -79,42 +100,79 @@ def get_jobs():
 
     page = max(1, request.args.get('page', 1, type=int))
     page_size = min(request.args.get('page_size', 50, type=int), 200)
+    if page_size < 1:
+        page_size = 50
 
-    pagination = query.paginate(page=page, per_page=page_size, error_out=False)
+    # COUNT(*) OVER () returns the filtered total with the page itself,
+    # so the WHERE clause runs once instead of again for paginate()'s count
+    rows = (
+        query.add_columns(db.func.count().over())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .all()
+    )
+    if rows:
+        total = rows[0][1]
+    else:
+        # Past the last page (or no matches) – no row carries the total
+        total = query.order_by(None).count() if page > 1 else 0
+    total_pages = -(-total // page_size)
 
     return jsonify({
-        'jobs': [job.to_dict() for job in pagination.items],
-        'total': pagination.total,
-        'page': pagination.page,
+        'jobs': [job.to_dict() for job, _ in rows],
+        'total': total,
+        'page': page,
         'page_size': page_size,
-        'total_pages': pagination.pages,
-        'has_next': pagination.has_next,
-        'has_prev': pagination.has_prev,
+        'total_pages': total_pages,
+        'has_next': page < total_pages,
+        'has_prev': page > 1,
     })
 
 
 # ── CSV Export ───────────────────────────────────────────────────────
 
+_EXPORT_HEADERS = [
+    'S/NO', 'Company Name', 'Job Title', 'Job Link', 'Location',
+    'Salary', 'Category', 'Experience Level', 'Job Type', 'Source', 'Scrape Date',
+]
+# Same order as the header row (after S/NO)
+_EXPORT_COLUMNS = (
+    Job.company, Job.title, Job.url, Job.location,
+    Job.salary, Job.category, Job.experience_level, Job.job_type,
+    Job.source, Job.scrape_date,
+)
+_EXPORT_CHUNK_SIZE = 1000
+
+
+def _export_rows():
+    """Filtered export rows as plain tuples, fetched in streamed chunks."""
+    return (
+        _build_jobs_query()
+        .with_entities(*_EXPORT_COLUMNS)
+        .yield_per(_EXPORT_CHUNK_SIZE)
+    )
+
+
 @api_bp.route('/jobs/export/csv')
 def export_csv():
-    jobs = _build_jobs_query().all()
-
-    buf = io.StringIO()
-    writer = csv.writer(buf)
-    writer.writerow([
-        'S/NO', 'Company Name', 'Job Title', 'Job Link', 'Location',
-        'Salary', 'Category', 'Experience Level', 'Job Type', 'Source', 'Scrape Date',
-    ])
-    for idx, job in enumerate(jobs, 1):
-        writer.writerow([
-            idx, job.company, job.title, job.url, job.location,
-            job.salary or '', job.category or '', job.experience_level or '',
-            job.job_type or '', job.source, job.scrape_date.isoformat(),
-        ])
+    rows = _export_rows()
+
+    def generate():
+        # csv writes None as '' and dates as ISO strings, so row tuples
+        # go to the writer unchanged; the buffer is flushed per chunk.
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(_EXPORT_HEADERS)
+        for idx, row in enumerate(rows, 1):
+            writer.writerow((idx, *row))
+            if idx % _EXPORT_CHUNK_SIZE == 0:
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+        yield buf.getvalue()
 
-    buf.seek(0)
     return Response(
-        buf.getvalue(),
+        stream_with_context(generate()),
         mimetype='text/csv',
         headers={
             'Content-Disposition':
@@ -125,51 +183,58 @@ def export_csv():
 
 # ── Excel Export ─────────────────────────────────────────────────────
 
+def _export_col_widths():
+    """Auto-fit widths for the export columns, from one aggregate query.
+
+    The longest value per column is measured in SQL so the export loop
+    never has to inspect individual cells.
+    """
+    text_cols = _EXPORT_COLUMNS[:-1]  # scrape_date is always 10 chars
+    total, *longest = (
+        _build_jobs_query()
+        .order_by(None)
+        .with_entities(
+            db.func.count(),
+            *(db.func.max(db.func.length(col)) for col in text_cols),
+        )
+        .one()
+    )
+    data_lens = [len(str(total)), *(n or 0 for n in longest), 10]
+    return [
+        min(max(len(header), n) + 2, 50)
+        for header, n in zip(_EXPORT_HEADERS, data_lens)
+    ]
+
+
 @api_bp.route('/jobs/export/excel')
 def export_excel():
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment
+    from xlsxwriter import Workbook
 
-    jobs = _build_jobs_query().all()
+    # constant_memory flushes each row to a temp file once the next row
+    # starts, so memory stays flat regardless of export size.
+    buf = io.BytesIO()
+    wb = Workbook(buf, {
+        'constant_memory': True,
+        'strings_to_urls': False,
+        'strings_to_formulas': False,
+    })
+    ws = wb.add_worksheet('UK Jobs')
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = 'UK Jobs'
+    for col, width in enumerate(_export_col_widths()):
+        ws.set_column(col, col, width)
 
-    headers = [
-        'S/NO', 'Company Name', 'Job Title', 'Job Link', 'Location',
-        'Salary', 'Category', 'Experience Level', 'Job Type', 'Source', 'Scrape Date',
-    ]
-    ws.append(headers)
-
-    header_font = Font(bold=True, color='FFFFFF')
-    header_fill = PatternFill(start_color='1a73e8', end_color='1a73e8', fill_type='solid')
-    for cell in ws[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center')
-
-    for idx, job in enumerate(jobs, 1):
-        ws.append([
-            idx, job.company, job.title, job.url, job.location,
-            job.salary or '', job.category or '', job.experience_level or '',
-            job.job_type or '', job.source, job.scrape_date.isoformat(),
-        ])
-
-    # Auto-adjust column widths
-    for col_cells in ws.columns:
-        max_len = 0
-        col_letter = col_cells[0].column_letter
-        for cell in col_cells:
-            try:
-                if len(str(cell.value)) > max_len:
-                    max_len = len(str(cell.value))
-            except TypeError:
-                pass
-        ws.column_dimensions[col_letter].width = min(max_len + 2, 50)
+    header_fmt = wb.add_format({
+        'bold': True, 'font_color': 'white',
+        'bg_color': '#1a73e8', 'align': 'center',
+    })
+    ws.write_row(0, 0, _EXPORT_HEADERS, header_fmt)
 
-    buf = io.BytesIO()
-    wb.save(buf)
+    # None values are written as empty cells
+    for idx, row in enumerate(_export_rows(), 1):
+        *values, scrape_date = row
+        ws.write_row(idx, 0, (idx, *values, scrape_date.isoformat()))
+
+    wb.close()
     buf.seek(0)
 
     return send_file(
@@ -188,15 +253,30 @@ def daily_json(date_str):
     if not target:
         return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
 
+    headers = {'Content-Disposition': f'attachment; filename=jobs_{date_str}.json'}
+
+    # Past days are immutable – serve the snapshot written by the scraper
+    snapshot = os.path.join(
+        current_app.config['DAILY_JSON_DIR'], f'{target.isoformat()}.json.gz'
+    )
+    if target < date.today() and os.path.exists(snapshot):
+        with open(snapshot, 'rb') as f:
+            body = f.read()
+        # The body depends on Accept-Encoding; shared caches must key on it
+        headers['Vary'] = 'Accept-Encoding'
+        if request.accept_encodings['gzip']:
+            headers['Content-Encoding'] = 'gzip'
+        else:
+            body = gzip.decompress(body)
+        return Response(body, mimetype='application/json', headers=headers)
+
     jobs = Job.query.filter_by(scrape_date=target).all()
     data = [job.to_json_export() for job in jobs]
 
     return Response(
         json.dumps(data, indent=2),
         mimetype='application/json',
-        headers={
-            'Content-Disposition': f'attachment; filename=jobs_{date_str}.json'
-        },
+        headers=headers,
     )
 
 
@@ -243,6 +323,13 @@ def get_stats():
     )
     date_to = _parse_date(request.args.get('date_to'), date.today())
 
+    return jsonify(cache.cached(
+        ('stats', date_from, date_to), _STATS_CACHE_TTL,
+        lambda: _load_stats(date_from, date_to),
+    ))
+
+
+def _load_stats(date_from, date_to):
     total_jobs = Job.query.filter(
         Job.scrape_date >= date_from,
         Job.scrape_date <= date_to,
@@ -263,7 +350,7 @@ def get_stats():
 
     last_run = ScrapeRun.query.order_by(ScrapeRun.started_at.desc()).first()
 
-    return jsonify({
+    return {
         'total_jobs': total_jobs,
         'unique_companies': unique_companies or 0,
         'sources': {s: c for s, c in sources},
@@ -277,34 +364,48 @@ def get_stats():
             'jobs_found': last_run.jobs_found,
             'new_jobs': last_run.new_jobs,
         } if last_run else None,
-    })
+    }
 
 
 # ── Available scrape dates ───────────────────────────────────────────
 
 @api_bp.route('/dates')
 def get_dates():
+    return jsonify(cache.cached('dates', _STATS_CACHE_TTL, _load_dates))
+
+
+def _load_dates():
     rows = (
         db.session.query(Job.scrape_date, db.func.count(Job.id))
         .group_by(Job.scrape_date)
         .order_by(Job.scrape_date.desc())
         .all()
     )
-    return jsonify({
+    return {
         'dates': [{'date': d.isoformat(), 'count': c} for d, c in rows],
-    })
+    }
 
 
 # ── Manual scrape trigger ────────────────────────────────────────────
 
 @api_bp.route('/scrape', methods=['POST'])
 def trigger_scrape():
-    from flask import current_app
-    from scraper.engine import ScrapingEngine
+    """Start a scrape in the background; poll /scrape/status for the result."""
+    from scraper.engine import ScrapingEngine, start_background_run
+
+    if ScrapingEngine.active_run() is not None:
+        return jsonify({
+            'status': 'busy',
+            'error': 'A scrape is already running.',
+        })
 
-    engine = ScrapingEngine(current_app._get_current_object())
-    result = engine.run()
-    return jsonify(result)
+    # The client waits for a finished run newer than this one
+    last_run = ScrapeRun.query.order_by(ScrapeRun.started_at.desc()).first()
+    start_background_run(current_app._get_current_object())
+    return jsonify({
+        'status': 'started',
+        'last_run_id': last_run.id if last_run else None,
+    }), 202
 
 
 # ── Scrape status ────────────────────────────────────────────────────
@@ -323,6 +424,7 @@ def scrape_status():
         'new_jobs': last_run.new_jobs,
         'duplicates': last_run.duplicates,
         'failed_sources': last_run.failed_sources,
+        'error': last_run.log if last_run.status == 'failed' else None,
         'started_at': last_run.started_at.isoformat() if last_run.started_at else None,
         'completed_at': last_run.completed_at.isoformat() if last_run.completed_at else None,
     })
@@ -332,7 +434,11 @@ def scrape_status():
 
 @api_bp.route('/companies')
 def get_companies():
+    return jsonify(cache.cached('companies', _STATS_CACHE_TTL, _load_companies))
+
+
+def _load_companies():
     companies = TargetCompany.query.filter_by(active=True).order_by(TargetCompany.name).all()
-    return jsonify({
+    return {
         'companies': [{'id': c.id, 'name': c.name} for c in companies],
-    })
+    }
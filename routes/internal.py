@@ -0,0 +1,30 @@
+"""Internal routes called by the external scheduler (systemd timer / cron)."""
+import hmac
+import logging
+
+from flask import Blueprint, current_app, request, jsonify
+
+internal_bp = Blueprint('internal', __name__, url_prefix='/internal')
+logger = logging.getLogger(__name__)
+
+
+@internal_bp.route('/scrape', methods=['POST'])
+def scheduled_scrape():
+    """Start the daily scrape; requires the ``X-Scrape-Token`` header.
+
+    The scrape runs in a background thread so the trigger returns at
+    once instead of holding a worker past its request timeout.
+    """
+    token = current_app.config.get('SCRAPE_TOKEN')
+    if not token:
+        return jsonify({'error': 'Not found'}), 404
+
+    supplied = request.headers.get('X-Scrape-Token', '')
+    if not hmac.compare_digest(supplied.encode(), token.encode()):
+        return jsonify({'error': 'Forbidden'}), 403
+
+    from scraper.engine import start_background_run
+
+    logger.info("Internal trigger: starting daily scrape")
+    start_background_run(current_app._get_current_object())
+    return jsonify({'status': 'started'}), 202
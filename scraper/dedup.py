@@ -1,6 +1,7 @@
 """Deduplication utilities for scraped job data."""
 import hashlib
 import re
+from functools import lru_cache
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from typing import List, Set, Tuple
 from .sources.base import JobData
@@ -12,31 +13,58 @@ _TRACKING_PARAMS = frozenset({
 })
 
 
+# Characters that make urlparse do more than split off the host: a query,
+# params, fragment, stripped control chars, or IPv6 brackets
+_NEEDS_PARSE = frozenset('?;#[]\t\r\n')
+
+
 def canonicalize_url(url: str) -> str:
     """Normalize a URL for deduplication – strips tracking params, lowercases, etc."""
+    lowered = url.strip().lower()
+    # Fast path for plain http(s) URLs with a host: urlparse/urlunparse
+    # would only drop trailing slashes from the path, so do that directly.
+    scheme, sep, rest = lowered.partition('://')
+    if (sep and scheme in ('https', 'http') and rest[:1] not in ('', '/')
+            and lowered.isascii() and _NEEDS_PARSE.isdisjoint(rest)):
+        return lowered.rstrip('/')
+
     try:
-        parsed = urlparse(url.strip().lower())
-        qs = parse_qs(parsed.query)
-        filtered_qs = {k: v for k, v in qs.items() if k not in _TRACKING_PARAMS}
-        clean_query = urlencode(filtered_qs, doseq=True)
+        parsed = urlparse(lowered)
+        clean_query = ''
+        # parse_qs + urlencode dominate the cost; most job URLs have no query
+        if parsed.query:
+            qs = parse_qs(parsed.query)
+            filtered_qs = {k: v for k, v in qs.items() if k not in _TRACKING_PARAMS}
+            clean_query = urlencode(filtered_qs, doseq=True)
         clean_path = parsed.path.rstrip('/')
         return urlunparse((parsed.scheme, parsed.netloc, clean_path, '', clean_query, ''))
     except Exception:
         return url.strip().lower()
 
 
-def url_hash(url: str) -> str:
-    """SHA-256 based hash (first 32 hex chars) of the canonicalized URL."""
+@lru_cache(maxsize=65536)
+def url_hash(url: str) -> bytes:
+    """16-byte fingerprint (truncated SHA-256) of the canonicalized URL.
+
+    Stored raw in ``Job.url_hash``; it is the same value older rows held as
+    32 hex characters, so hex rows can be converted with ``bytes.fromhex``.
+    Memoised: dedup and the engine's store step hash the same URLs.
+    """
     canonical = canonicalize_url(url)
-    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]
+    return hashlib.sha256(canonical.encode('utf-8')).digest()[:16]
 
 
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]+')
+
+
+@lru_cache(maxsize=65536)
 def normalize_text(text: str) -> str:
-    """Lowercase, strip non-alphanumeric chars, collapse whitespace."""
-    text = text.lower().strip()
-    text = re.sub(r'[^a-z0-9\s]', '', text)
-    text = re.sub(r'\s+', ' ', text)
-    return text
+    """Lowercase, strip non-alphanumeric chars, collapse whitespace.
+
+    Memoised: company names in particular repeat across most of a batch.
+    """
+    # str.split() trims and collapses whitespace in C, no second regex
+    return ' '.join(_NON_ALNUM_RE.sub('', text.lower()).split())
 
 
 def is_similar_job(job1: JobData, job2: JobData) -> bool:
@@ -63,25 +91,21 @@ def deduplicate_jobs(jobs: List[JobData]) -> Tuple[List[JobData], int]:
     Returns:
         (unique_jobs, duplicate_count)
     """
-    seen_hashes: Set[str] = set()
-    seen_signatures: Set[str] = set()
+    seen_hashes: Set[bytes] = set()
+    seen_signatures: Set[Tuple[str, str]] = set()
     unique_jobs: List[JobData] = []
-    duplicate_count = 0
 
     for job in jobs:
         h = url_hash(job.url)
-
         if h in seen_hashes:
-            duplicate_count += 1
             continue
 
-        sig = f"{normalize_text(job.title)}|{normalize_text(job.company)}"
+        sig = (normalize_text(job.title), normalize_text(job.company))
         if sig in seen_signatures:
-            duplicate_count += 1
             continue
 
         seen_hashes.add(h)
         seen_signatures.add(sig)
         unique_jobs.append(job)
 
-    return unique_jobs, duplicate_count
+    return unique_jobs, len(jobs) - len(unique_jobs)
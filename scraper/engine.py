@@ -1,8 +1,13 @@
 """Main scraping orchestrator – coordinates sources, dedup, and storage."""
 import logging
 import json
-from datetime import date, datetime
-from typing import List, Optional
+import gzip
+import os
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Set
 
 from .sources.base import JobData
 from .sources.google_search import GoogleSearchSource
@@ -15,6 +20,7 @@ from .sources.reed import ReedSource
 from .sources.remotive import RemotiveSource
 from .sources.career_pages import CareerPageSource
 from .dedup import deduplicate_jobs, url_hash
+import cache
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +48,43 @@ GENERAL_QUERIES = [
     'biomedical scientist UK',
 ]
 
+# Hashes per IN (...) query, well under SQLite's bound-parameter limit
+HASH_LOOKUP_CHUNK = 500
+
+# A 'running' ScrapeRun older than this is assumed to belong to a crashed
+# process and no longer blocks new runs.
+STALE_RUN_HOURS = 6
+
+# SQLite's lower() folds only A–Z; same-day signature keys built in Python
+# must fold the same way to match the ix_jobs_title_company_ci values.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _chunks(items: list, size: int = HASH_LOOKUP_CHUNK):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def start_background_run(app) -> threading.Thread:
+    """Run a full scrape on a daemon thread and return without waiting.
+
+    Used by the HTTP triggers so a multi-minute scrape never holds a web
+    worker; progress is read back from the ScrapeRun table.
+    """
+    thread = threading.Thread(
+        target=_background_run, args=(app,), name='scrape-run', daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def _background_run(app):
+    try:
+        result = ScrapingEngine(app).run()
+        logger.info(f"Background scrape result: {result}")
+    except Exception as e:
+        logger.error(f"Background scrape failed: {e}", exc_info=True)
+
 
 class ScrapingEngine:
     """Runs a full scrape cycle: fetch → filter → dedup → store."""
@@ -56,6 +99,10 @@ class ScrapingEngine:
             'REQUEST_DELAY_MAX': app.config.get('REQUEST_DELAY_MAX', 4.0),
             'MAX_PAGES_PER_SOURCE': app.config.get('MAX_PAGES_PER_SOURCE', 5),
             'MAX_RESULTS_PER_COMPANY': app.config.get('MAX_RESULTS_PER_COMPANY', 50),
+            'CAREER_WORKERS': app.config.get('CAREER_WORKERS', 8),
+            'DAILY_JSON_DIR': app.config.get('DAILY_JSON_DIR'),
+            'SEARCH_CACHE_DIR': app.config.get('SEARCH_CACHE_DIR'),
+            'SEARCH_CACHE_TTL': app.config.get('SEARCH_CACHE_TTL', 0),
         }
 
         # Sources ordered by expected yield (highest first).
@@ -77,7 +124,7 @@ class ScrapingEngine:
     # ------------------------------------------------------------------
     def run(self, target_date: Optional[date] = None) -> dict:
         """Execute a full scraping run for *target_date* (defaults to today)."""
-        from models import db, Job, TargetCompany, ScrapeRun
+        from models import db, Job, TargetCompany
 
         if target_date is None:
             target_date = date.today()
@@ -85,14 +132,15 @@ class ScrapingEngine:
         logger.info(f"=== Starting scrape run for {target_date} ===")
 
         with self.app.app_context():
-            # Create a run record
-            run = ScrapeRun(
-                run_date=target_date,
-                status='running',
-                started_at=datetime.utcnow(),
-            )
-            db.session.add(run)
-            db.session.commit()
+            # Create a run record – doubles as the lock against overlapping runs
+            run = self._claim_run(target_date)
+            if run is None:
+                logger.warning("Scrape already in progress – skipping this run")
+                return {
+                    'status': 'busy',
+                    'error': 'A scrape is already running.',
+                    'date': target_date.isoformat(),
+                }
 
             try:
                 # Load target companies (names + career URLs)
@@ -108,45 +156,53 @@ class ScrapingEngine:
                     f"({len(company_urls)} with career URLs)"
                 )
 
-                # ---- Scrape from all available sources ----
-                all_jobs: List[JobData] = []
-                failed_sources = 0
-
+                # ---- Scrape all available sources concurrently ----
+                # Sources are independent and network-bound; results are
+                # gathered in source order so batch dedup stays stable.
+                tasks = []
                 for source in self.sources:
                     if not source.is_available():
                         logger.info(
                             f"Source '{source.name}' skipped (not configured)"
                         )
                         continue
+                    logger.info(f"Scraping source: {source.name}")
+                    tasks.append((
+                        f"Source '{source.name}'",
+                        source.scrape, (companies, GENERAL_QUERIES),
+                    ))
 
-                    try:
-                        logger.info(f"Scraping source: {source.name}")
-                        source_jobs = source.scrape(companies, GENERAL_QUERIES)
-                        logger.info(
-                            f"Source '{source.name}' returned "
-                            f"{len(source_jobs)} raw jobs"
-                        )
-                        all_jobs.extend(source_jobs)
-                    except Exception as e:
-                        logger.error(f"Source '{source.name}' failed: {e}")
-                        failed_sources += 1
-
-                # ---- Scrape company career pages ----
+                # ---- Company career pages run in the same pool ----
                 if company_urls:
-                    try:
-                        logger.info(
-                            f"Scraping {len(company_urls)} company career pages"
-                        )
-                        career_jobs = self.career_page_source.scrape_career_pages(
-                            company_urls
-                        )
-                        logger.info(
-                            f"Career pages returned {len(career_jobs)} raw jobs"
-                        )
-                        all_jobs.extend(career_jobs)
-                    except Exception as e:
-                        logger.error(f"Career page source failed: {e}")
-                        failed_sources += 1
+                    logger.info(
+                        f"Scraping {len(company_urls)} company career pages"
+                    )
+                    tasks.append((
+                        'Career pages',
+                        self.career_page_source.scrape_career_pages,
+                        (company_urls,),
+                    ))
+
+                all_jobs: List[JobData] = []
+                failed_sources = 0
+
+                if tasks:
+                    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+                        futures = [
+                            (label, pool.submit(fn, *args))
+                            for label, fn, args in tasks
+                        ]
+                        for label, future in futures:
+                            try:
+                                source_jobs = future.result()
+                                logger.info(
+                                    f"{label} returned "
+                                    f"{len(source_jobs)} raw jobs"
+                                )
+                                all_jobs.extend(source_jobs)
+                            except Exception as e:
+                                logger.error(f"{label} failed: {e}")
+                                failed_sources += 1
 
                 # ---- Filter UK-only ----
                 uk_jobs = [j for j in all_jobs if j.is_uk_based()]
@@ -162,51 +218,58 @@ class ScrapingEngine:
                 )
 
                 # ---- Store in database ----
-                new_count = 0
-                cross_day_dupes = 0
+                hashes = [url_hash(j.url) for j in unique_jobs]
+                # (title, company) folded like the database's lower(),
+                # computed once per job
+                fold = self._sql_lower()
+                sigs = [(fold(j.title), fold(j.company)) for j in unique_jobs]
+                stored_today, first_seen_by_hash = self._load_seen_hashes(
+                    hashes, target_date
+                )
+                stored_sigs = self._load_stored_signatures(
+                    {title for title, _ in sigs}, target_date
+                )
 
-                for job_data in unique_jobs:
-                    h = url_hash(job_data.url)
+                new_rows = []
+                cross_day_dupes = 0
 
-                    # Already stored for this date?
-                    existing_today = Job.query.filter_by(
-                        url_hash=h, scrape_date=target_date
-                    ).first()
-                    if existing_today:
+                for job_data, h, sig in zip(unique_jobs, hashes, sigs):
+                    # Already stored for this date, under this or another URL?
+                    if h in stored_today or sig in stored_sigs:
                         cross_day_dupes += 1
                         continue
+                    stored_today.add(h)
+                    stored_sigs.add(sig)
 
-                    # Seen on a previous day?
-                    existing_prev = (
-                        Job.query.filter_by(url_hash=h)
-                        .order_by(Job.scrape_date.desc())
-                        .first()
-                    )
-                    first_seen = (
-                        existing_prev.first_seen_date
-                        if existing_prev
-                        else target_date
-                    )
-                    if existing_prev:
-                        existing_prev.last_seen_date = target_date
-
-                    new_job = Job(
-                        title=job_data.title,
-                        company=job_data.company,
-                        location=job_data.location,
-                        category=job_data.category,
-                        experience_level=job_data.experience_level,
-                        job_type=job_data.job_type,
-                        salary=job_data.salary,
-                        url=job_data.url,
-                        url_hash=h,
-                        source=job_data.source,
-                        scrape_date=target_date,
-                        first_seen_date=first_seen,
-                        last_seen_date=target_date,
+                    new_rows.append({
+                        'title': job_data.title,
+                        'company': job_data.company,
+                        'location': job_data.location,
+                        'category': job_data.category,
+                        'experience_level': job_data.experience_level,
+                        'job_type': job_data.job_type,
+                        'salary': job_data.salary,
+                        'url': job_data.url,
+                        'url_hash': h,
+                        'source': job_data.source,
+                        'scrape_date': target_date,
+                        # Seen on a previous day?
+                        'first_seen_date': first_seen_by_hash.get(h, target_date),
+                        'last_seen_date': target_date,
+                    })
+
+                # Earlier sightings of re-seen URLs were last seen today
+                reseen = [r['url_hash'] for r in new_rows
+                          if r['url_hash'] in first_seen_by_hash]
+                for chunk in _chunks(reseen):
+                    db.session.execute(
+                        db.update(Job)
+                        .where(Job.url_hash.in_(chunk))
+                        .values(last_seen_date=target_date)
                     )
-                    db.session.add(new_job)
-                    new_count += 1
+                if new_rows:
+                    db.session.execute(db.insert(Job), new_rows)
+                new_count = len(new_rows)
 
                 db.session.commit()
 
@@ -226,6 +289,7 @@ class ScrapingEngine:
                     'failed_sources': failed_sources,
                 })
                 db.session.commit()
+                cache.clear()
 
                 result = {
                     'status': 'completed',
@@ -236,6 +300,17 @@ class ScrapingEngine:
                     'failed_sources': failed_sources,
                 }
                 logger.info(f"=== Scrape run completed: {result} ===")
+
+                try:
+                    self._write_daily_json(target_date)
+                except Exception as e:
+                    logger.error(f"Daily JSON export failed: {e}")
+
+                try:
+                    self._vacuum_jobs()
+                except Exception as e:
+                    logger.warning(f"VACUUM (ANALYZE) jobs failed: {e}")
+
                 return result
 
             except Exception as e:
@@ -244,8 +319,166 @@ class ScrapingEngine:
                 run.completed_at = datetime.utcnow()
                 run.log = str(e)
                 db.session.commit()
+                cache.clear()
                 return {
                     'status': 'failed',
                     'error': str(e),
                     'date': target_date.isoformat(),
                 }
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _load_seen_hashes(hashes: List[bytes], target_date: date):
+        """Look up which *hashes* are already stored, in a few IN queries.
+
+        Returns ``(stored_today, first_seen_by_hash)``: the hashes already
+        stored for *target_date*, and the earliest first_seen_date of each
+        hash stored on an earlier day.
+        """
+        from models import db, Job
+
+        stored_today = set()
+        first_seen_by_hash = {}
+        for chunk in _chunks(hashes):
+            stored_today.update(
+                h for (h,) in db.session.query(Job.url_hash).filter(
+                    Job.scrape_date == target_date, Job.url_hash.in_(chunk)
+                )
+            )
+            first_seen_by_hash.update(
+                db.session.query(Job.url_hash, db.func.min(Job.first_seen_date))
+                .filter(Job.url_hash.in_(chunk), Job.scrape_date < target_date)
+                .group_by(Job.url_hash)
+            )
+        return stored_today, first_seen_by_hash
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _sql_lower():
+        """A ``str`` case fold matching the database's ``lower()``.
+
+        SQLite's ``lower()`` leaves non-ASCII capitals alone, so keys built
+        with ``str.lower()`` would miss stored titles like "Ørsted".
+        """
+        from models import db
+
+        if db.engine.dialect.name == 'sqlite':
+            return lambda text: text.translate(_ASCII_LOWER)
+        return str.lower
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _load_stored_signatures(titles: Set[str], target_date: date):
+        """Lower-cased ``(title, company)`` pairs already stored for *target_date*.
+
+        Only the *titles* – folded by :meth:`_sql_lower` – are looked up,
+        via ``ix_jobs_title_company_ci``.
+        """
+        from models import db, Job
+
+        titles = list(titles)
+        title_ci = db.func.lower(Job.title)
+        company_ci = db.func.lower(Job.company)
+
+        stored = set()
+        for chunk in _chunks(titles):
+            stored.update(
+                db.session.query(title_ci, company_ci).filter(
+                    title_ci.in_(chunk), Job.scrape_date == target_date
+                )
+            )
+        return stored
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _claim_run(target_date: date):
+        """Insert a 'running' ScrapeRun unless another run holds one.
+
+        The check and insert happen in one serialised transaction –
+        ``BEGIN IMMEDIATE`` on SQLite, a transaction-scoped advisory lock
+        on PostgreSQL – so a scheduled and a manual trigger can't both
+        start.  Returns the new run, or None if a run is in progress.
+        """
+        from models import db, ScrapeRun
+
+        dialect = db.engine.dialect.name
+        if dialect == 'sqlite':
+            db.session.execute(db.text('BEGIN IMMEDIATE'))
+        elif dialect == 'postgresql':
+            db.session.execute(db.text(
+                "SELECT pg_advisory_xact_lock(hashtext('daily_scrape'))"
+            ))
+
+        try:
+            if ScrapingEngine.active_run() is not None:
+                db.session.rollback()
+                return None
+
+            run = ScrapeRun(
+                run_date=target_date,
+                status='running',
+                started_at=datetime.utcnow(),
+            )
+            db.session.add(run)
+            db.session.commit()
+            cache.clear()
+            return run
+        except Exception:
+            db.session.rollback()
+            raise
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def active_run():
+        """Return the ScrapeRun currently in progress, or None."""
+        from models import ScrapeRun
+
+        stale_before = datetime.utcnow() - timedelta(hours=STALE_RUN_HOURS)
+        return ScrapeRun.query.filter(
+            ScrapeRun.status == 'running',
+            ScrapeRun.started_at >= stale_before,
+        ).first()
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _vacuum_jobs() -> None:
+        """Run ``VACUUM (ANALYZE) jobs`` on PostgreSQL after the daily insert.
+
+        /dates and /stats count rows through ix_jobs_scrape_date_id; an
+        index-only scan still visits the heap for pages not yet marked
+        all-visible, which is every page the run just wrote until
+        autovacuum gets round to it.
+        """
+        from models import db
+
+        if db.engine.dialect.name != 'postgresql':
+            return
+        with db.engine.connect().execution_options(
+            isolation_level='AUTOCOMMIT'
+        ) as conn:
+            conn.exec_driver_sql('VACUUM (ANALYZE) jobs')
+
+    # ------------------------------------------------------------------
+    def _write_daily_json(self, target_date: date) -> None:
+        """Snapshot *target_date*'s jobs to ``<DAILY_JSON_DIR>/<date>.json.gz``.
+
+        Past days never change, so the daily-json endpoint can serve this
+        file instead of querying the database.  Rewritten on every run so
+        a later manual scrape on the same day refreshes it.
+        """
+        from models import Job
+
+        out_dir = self.config.get('DAILY_JSON_DIR')
+        if not out_dir:
+            return
+        os.makedirs(out_dir, exist_ok=True)
+
+        jobs = Job.query.filter_by(scrape_date=target_date).all()
+        body = json.dumps([job.to_json_export() for job in jobs], indent=2)
+
+        path = os.path.join(out_dir, f'{target_date.isoformat()}.json.gz')
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(gzip.compress(body.encode('utf-8')))
+        os.replace(tmp_path, path)
+        logger.info(f"Wrote daily JSON snapshot: {path} ({len(jobs)} jobs)")
@@ -1,9 +1,22 @@
 """Adzuna API job source – free, UK-focused job API."""
-import requests
-import time
-import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional
-from .base import BaseSource, JobData
+import orjson
+from .base import (
+    BaseSource, JobData, RateLimiter, first_label, keyword_table,
+    pooled_session,
+)
+
+
+# Checked in order – the first level with any keyword in the title wins.
+_EXPERIENCE_LEVELS = keyword_table(
+    ('Senior Level', ('senior', 'sr.', 'sr ', 'lead', 'principal', 'staff')),
+    ('Entry Level', ('junior', 'jr.', 'jr ', 'entry', 'graduate', 'trainee', 'intern')),
+    ('Mid Level', ('mid', 'intermediate')),
+    ('Director / Executive', ('director', 'head of', 'vp ', 'vice president', 'chief', 'cto', 'cfo')),
+    ('Manager', ('manager',)),
+)
 
 
 class AdzunaSource(BaseSource):
@@ -12,6 +25,16 @@ class AdzunaSource(BaseSource):
     name = "adzuna"
     BASE_URL = "https://api.adzuna.com/v1/api/jobs/gb/search"
 
+    # Adzuna's default API quota is 25 hits/minute; queries run on a few
+    # threads sharing one limiter and one keep-alive connection pool.
+    REQUESTS_PER_MINUTE = 25
+    MAX_WORKERS = 4
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.session = pooled_session(pool_size=self.MAX_WORKERS)
+        self.limiter = RateLimiter(self.REQUESTS_PER_MINUTE)
+
     def is_available(self) -> bool:
         return bool(
             self.config.get('ADZUNA_APP_ID') and self.config.get('ADZUNA_API_KEY')
@@ -28,21 +51,21 @@ class AdzunaSource(BaseSource):
         # Add general discovery queries
         all_queries.extend(general_queries)
 
-        for query in all_queries:
-            try:
-                page_jobs = self._search(query)
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            for page_jobs in pool.map(self._search_query, all_queries):
                 jobs.extend(page_jobs)
-                self.logger.info(f"Found {len(page_jobs)} jobs for query '{query}'")
-            except Exception as e:
-                self.logger.error(f"Error searching for '{query}': {e}")
-
-            time.sleep(random.uniform(
-                self.config.get('REQUEST_DELAY_MIN', 1.0),
-                self.config.get('REQUEST_DELAY_MAX', 3.0),
-            ))
 
         return jobs
 
+    def _search_query(self, query: str) -> List[JobData]:
+        try:
+            page_jobs = self._search(query)
+            self.logger.info(f"Found {len(page_jobs)} jobs for query '{query}'")
+            return page_jobs
+        except Exception as e:
+            self.logger.error(f"Error searching for '{query}': {e}")
+            return []
+
     def _search(self, query: str, max_pages: int = None) -> List[JobData]:
         if max_pages is None:
             max_pages = self.config.get('MAX_PAGES_PER_SOURCE', 3)
@@ -63,9 +86,10 @@ class AdzunaSource(BaseSource):
                     'content-type': 'application/json',
                 }
 
-                response = requests.get(url, params=params, timeout=30)
+                self.limiter.wait()
+                response = self.session.get(url, params=params, timeout=30)
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 results = data.get('results', [])
                 if not results:
@@ -89,8 +113,6 @@ class AdzunaSource(BaseSource):
                 if page * 50 >= data.get('count', 0):
                     break
 
-                time.sleep(random.uniform(0.5, 1.5))
-
             except Exception as e:
                 self.logger.error(f"Page {page} error for '{query}': {e}")
                 break
@@ -110,16 +132,6 @@ class AdzunaSource(BaseSource):
         return ', '.join(parts) if parts else None
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _guess_experience(title: str) -> Optional[str]:
-        title_lower = title.lower()
-        if any(k in title_lower for k in ('senior', 'sr.', 'sr ', 'lead', 'principal', 'staff')):
-            return 'Senior Level'
-        if any(k in title_lower for k in ('junior', 'jr.', 'jr ', 'entry', 'graduate', 'trainee', 'intern')):
-            return 'Entry Level'
-        if any(k in title_lower for k in ('mid', 'intermediate')):
-            return 'Mid Level'
-        if any(k in title_lower for k in ('director', 'head of', 'vp ', 'vice president', 'chief', 'cto', 'cfo')):
-            return 'Director / Executive'
-        if 'manager' in title_lower:
-            return 'Manager'
-        return None
+        return first_label(_EXPERIENCE_LEVELS, title.lower())
@@ -1,9 +1,9 @@
 """Arbeitnow API – free job board API with UK listings, no authentication required."""
-import requests
 import time
 import logging
 from typing import List, Optional
-from .base import BaseSource, JobData
+import orjson
+from .base import BaseSource, JobData, pooled_session, guess_experience
 
 
 class ArbeitnowSource(BaseSource):
@@ -12,6 +12,12 @@ class ArbeitnowSource(BaseSource):
     name = "arbeitnow"
     BASE_URL = "https://www.arbeitnow.com/api/job-board-api"
 
+    def __init__(self, config: dict):
+        super().__init__(config)
+        # Pages are fetched one after another – keep one connection alive
+        self.session = pooled_session(pool_size=2)
+        self.session.headers['Accept'] = 'application/json'
+
     def is_available(self) -> bool:
         return True  # Always available – no API key needed
 
@@ -23,17 +29,16 @@ class ArbeitnowSource(BaseSource):
 
         while page <= max_pages:
             try:
-                resp = requests.get(
+                resp = self.session.get(
                     self.BASE_URL,
                     params={'page': page},
                     timeout=30,
-                    headers={'Accept': 'application/json'},
                 )
                 if resp.status_code != 200:
                     self.logger.warning(f"HTTP {resp.status_code} on page {page}")
                     break
 
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 items = data.get('data', [])
                 if not items:
                     break
@@ -49,7 +54,7 @@ class ArbeitnowSource(BaseSource):
                         url=item.get('url', ''),
                         source='arbeitnow',
                         category=self._extract_category(item.get('tags', [])),
-                        experience_level=self._guess_experience(item.get('title', '')),
+                        experience_level=guess_experience(item.get('title', '')),
                         job_type='Remote' if remote else None,
                     )
                     if job.is_valid():
@@ -79,18 +84,3 @@ class ArbeitnowSource(BaseSource):
             if tag.lower() not in skip:
                 return tag.title()
         return None
-
-    @staticmethod
-    def _guess_experience(title: str) -> Optional[str]:
-        tl = title.lower()
-        if any(k in tl for k in ('senior', 'sr.', 'lead', 'principal', 'staff')):
-            return 'Senior Level'
-        if any(k in tl for k in ('junior', 'jr.', 'entry', 'graduate', 'trainee', 'intern')):
-            return 'Entry Level'
-        if any(k in tl for k in ('mid', 'intermediate')):
-            return 'Mid Level'
-        if any(k in tl for k in ('director', 'head of', 'vp ', 'vice president', 'chief')):
-            return 'Director / Executive'
-        if 'manager' in tl:
-            return 'Manager'
-        return None
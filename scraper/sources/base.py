@@ -1,14 +1,194 @@
 """Base classes for job scraper sources."""
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import logging
+import random
+import re
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 
+def _any_of(terms, word_boundary: bool = False) -> str:
+    """Regex source matching any of *terms*, factored into a prefix trie.
+
+    ``re`` tries alternation branches one by one at every position; with
+    shared prefixes folded together ("north (?:east|west)") each position
+    costs roughly one branch per character – close to an Aho-Corasick
+    scan without the extra dependency.
+    """
+    trie: Dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # end of a term
+    pattern = _trie_regex(trie)
+    return rf'\b(?:{pattern})\b' if word_boundary else f'(?:{pattern})'
+
+
+def _trie_regex(node: dict) -> str:
+    branches = [
+        re.escape(ch) + _trie_regex(child)
+        for ch, child in node.items() if ch
+    ]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    # A term may end here, so the rest of the branch is optional
+    return f'(?:{body})?' if '' in node else body
+
+
+# ── UK location matching (JobData.is_uk_based) ──────────────────────
+# Each term list is folded into one compiled alternation so a location
+# is classified by a single C-level scan.
+
+# Reject explicitly non-UK locations first
+_NON_UK_INDICATORS = (
+    'usa only', 'us only', 'united states only',
+    'canada only', 'australia only',
+)
+
+# Explicit UK place names (safe as substring matches)
+_UK_PLACES = (
+    'united kingdom', 'england', 'scotland', 'wales',
+    'northern ireland', 'london', 'manchester', 'birmingham',
+    'leeds', 'glasgow', 'liverpool', 'edinburgh', 'bristol',
+    'sheffield', 'newcastle', 'nottingham', 'southampton',
+    'cardiff', 'belfast', 'leicester', 'coventry',
+    'cambridge', 'oxford', 'brighton', 'york', 'aberdeen',
+    'dundee', 'exeter', 'norwich', 'plymouth', 'derby',
+    'swansea', 'portsmouth', 'wolverhampton',
+    'warwick', 'surrey', 'essex', 'kent', 'sussex',
+    'hampshire', 'hertfordshire', 'berkshire', 'middlesex',
+    'staffordshire', 'lancashire', 'cheshire', 'somerset',
+    'dorset', 'devon', 'cornwall', 'wiltshire', 'norfolk',
+    'suffolk', 'cambridgeshire', 'oxfordshire', 'buckinghamshire',
+    'greater london', 'west midlands', 'east midlands',
+    'north west', 'north east', 'south west', 'south east',
+    'east anglia', 'yorkshire', 'great britain',
+    'remote, uk', 'remote - uk', 'hybrid - uk',
+)
+
+# Short codes and UK-eligible remote/global terms need word-boundary
+# matching, e.g. "uk" should match "UK, Remote" but not "Kaufbeuren"
+_UK_WORDS = (
+    'uk', 'gb',
+    'worldwide', 'global', 'anywhere', 'international',
+    'europe', 'emea', 'remote', 'hybrid',
+)
+
+_NON_UK_RE = re.compile(_any_of(_NON_UK_INDICATORS))
+_UK_LOCATION_RE = re.compile(
+    f'{_any_of(_UK_PLACES)}|{_any_of(_UK_WORDS, word_boundary=True)}'
+)
+
+
+@lru_cache(maxsize=8192)
+def _is_uk_location(location: str) -> bool:
+    """Memoised: a handful of locations ("London", "Remote") cover most jobs."""
+    location_lower = location.lower()
+    # Every non-UK indicator ends in "only"; skip the regex when it can't match
+    if 'only' in location_lower and _NON_UK_RE.search(location_lower):
+        return False
+    return _UK_LOCATION_RE.search(location_lower) is not None
+
+
+# ── Keyword classifiers (experience level, category, job type) ──────
+
+def keyword_table(*groups) -> Tuple[Tuple[str, str], ...]:
+    """Flatten ordered ``(label, keywords)`` groups into ``(keyword, label)``.
+
+    Keywords keep their group order, so scanning the flat table still
+    returns the first group that matches.
+    """
+    return tuple(
+        (keyword, label) for label, keywords in groups for keyword in keywords
+    )
+
+
+def first_label(table, text: str) -> Optional[str]:
+    """Label of the first keyword in a :func:`keyword_table` found in *text*.
+
+    Earlier groups win regardless of where in *text* their keywords
+    appear.  On short titles a flat loop of ``in`` tests (a C substring
+    search each, no call overhead) beats a compiled alternation per group.
+    """
+    for keyword, label in table:
+        if keyword in text:
+            return label
+    return None
+
+
+# Checked in order – the first level with any keyword in the title wins
+EXPERIENCE_LEVELS = keyword_table(
+    ('Senior Level', ('senior', 'sr.', 'lead', 'principal', 'staff')),
+    ('Entry Level', ('junior', 'jr.', 'entry', 'graduate', 'trainee', 'intern')),
+    ('Mid Level', ('mid', 'intermediate')),
+    ('Director / Executive', ('director', 'head of', 'vp ', 'vice president', 'chief')),
+    ('Manager', ('manager',)),
+)
+
+
+@lru_cache(maxsize=4096)
+def guess_experience(title: str) -> Optional[str]:
+    """Experience level for a job *title*, from :data:`EXPERIENCE_LEVELS`."""
+    return first_label(EXPERIENCE_LEVELS, title.lower())
+
+
+# Titles scraped from search results and career pages: the experience table
+# also catches "sr "/"jr ", apprenticeships and C-level roles.
+TITLE_EXPERIENCE_LEVELS = keyword_table(
+    ('Senior Level', ('senior', 'sr.', 'sr ', 'lead', 'principal', 'staff')),
+    ('Entry Level', ('junior', 'jr.', 'jr ', 'entry', 'graduate', 'trainee', 'intern', 'apprentice')),
+    ('Mid Level', ('mid', 'intermediate')),
+    ('Director / Executive', ('director', 'head of', 'vp ', 'vice president', 'chief', 'cto', 'cfo')),
+    ('Manager', ('manager',)),
+)
+
+TITLE_CATEGORIES = keyword_table(
+    ('Technology', (
+        'software', 'developer', 'engineer', 'frontend', 'backend',
+        'full-stack', 'fullstack', 'devops', 'sre', 'platform')),
+    ('Data & AI', (
+        'data scientist', 'data engineer', 'data analyst',
+        'machine learning', 'ai ', 'artificial intelligence', 'ml ')),
+    ('Product', ('product manager', 'product owner', 'product lead')),
+    ('Design', ('designer', 'ux', 'ui', 'design')),
+    ('Finance', (
+        'finance', 'accountant', 'auditor', 'actuary', 'tax',
+        'investment', 'banking')),
+    ('Legal', ('solicitor', 'lawyer', 'legal', 'paralegal', 'barrister')),
+    ('Consulting', ('consultant', 'consulting', 'advisory')),
+    ('Marketing', ('marketing', 'seo', 'content', 'brand')),
+    ('Sales', ('sales', 'business development', 'account executive')),
+    ('Healthcare', (
+        'nurse', 'doctor', 'clinical', 'medical', 'healthcare', 'nhs')),
+    ('Engineering', (
+        'mechanical', 'electrical', 'civil', 'structural', 'chemical')),
+    ('Cybersecurity', ('cyber', 'security', 'infosec', 'penetration')),
+    ('Project Management', (
+        'project manager', 'programme manager', 'scrum', 'delivery')),
+    ('Research & Analysis', ('analyst', 'research', 'quantitative')),
+)
+
+
 class JobData:
     """Standardized job data container."""
 
+    # Tens of thousands are held per run; slots drop the per-instance dict
+    __slots__ = (
+        'title', 'company', 'location', 'url', 'source',
+        'category', 'experience_level', 'job_type', 'salary',
+    )
+
     def __init__(
         self,
         title: str,
@@ -37,55 +217,7 @@ class JobData:
 
     def is_uk_based(self) -> bool:
         """Check if the job is UK-based or UK-eligible (remote covering UK)."""
-        import re
-        location_lower = self.location.lower().strip()
-
-        # Reject explicitly non-UK locations first
-        non_uk_indicators = [
-            'usa only', 'us only', 'united states only',
-            'canada only', 'australia only',
-        ]
-        if any(ind in location_lower for ind in non_uk_indicators):
-            return False
-
-        # Explicit UK place names (safe as substring matches)
-        uk_places = [
-            'united kingdom', 'england', 'scotland', 'wales',
-            'northern ireland', 'london', 'manchester', 'birmingham',
-            'leeds', 'glasgow', 'liverpool', 'edinburgh', 'bristol',
-            'sheffield', 'newcastle', 'nottingham', 'southampton',
-            'cardiff', 'belfast', 'leicester', 'coventry',
-            'cambridge', 'oxford', 'brighton', 'york', 'aberdeen',
-            'dundee', 'exeter', 'norwich', 'plymouth', 'derby',
-            'swansea', 'portsmouth', 'wolverhampton',
-            'warwick', 'surrey', 'essex', 'kent', 'sussex',
-            'hampshire', 'hertfordshire', 'berkshire', 'middlesex',
-            'staffordshire', 'lancashire', 'cheshire', 'somerset',
-            'dorset', 'devon', 'cornwall', 'wiltshire', 'norfolk',
-            'suffolk', 'cambridgeshire', 'oxfordshire', 'buckinghamshire',
-            'greater london', 'west midlands', 'east midlands',
-            'north west', 'north east', 'south west', 'south east',
-            'east anglia', 'yorkshire', 'great britain',
-            'remote, uk', 'remote - uk', 'hybrid - uk',
-        ]
-        if any(p in location_lower for p in uk_places):
-            return True
-
-        # Short codes that need word-boundary matching to avoid false positives
-        # e.g. "uk" should match "UK" or "UK, Remote" but not "Kaufbeuren"
-        short_codes = ['uk', 'gb']
-        for code in short_codes:
-            if re.search(r'\b' + code + r'\b', location_lower):
-                return True
-
-        # UK-eligible remote/global locations (word-boundary for short terms)
-        global_exact = ['worldwide', 'global', 'anywhere', 'international',
-                        'europe', 'emea', 'remote', 'hybrid', 'remote/hybrid']
-        for term in global_exact:
-            if re.search(r'\b' + re.escape(term) + r'\b', location_lower):
-                return True
-
-        return False
+        return _is_uk_location(self.location)
 
     def to_dict(self) -> Dict:
         return {
@@ -128,3 +260,96 @@ class BaseSource(ABC):
             List of JobData objects.
         """
         pass
+
+
+class _CappedRetry(Retry):
+    """``Retry`` that honours ``Retry-After`` for at most ``RETRY_AFTER_MAX`` s.
+
+    urllib3 otherwise sleeps for whatever the server asks – an hour-long
+    Retry-After would stall the source's thread, and the whole run with it.
+    Longer pacing is left to the sources' rate limiters.
+    """
+
+    RETRY_AFTER_MAX = 30.0
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.RETRY_AFTER_MAX)
+
+
+def pooled_session(pool_size: int = 16, retries: int = 3) -> requests.Session:
+    """``requests.Session`` with keep-alive pooling and retry/backoff.
+
+    Reusing connections skips a TCP + TLS handshake per request; 429 and
+    5xx responses are retried with exponential backoff, waiting out a
+    Retry-After of up to ``_CappedRetry.RETRY_AFTER_MAX`` seconds.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=_CappedRetry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=None,
+        ),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls ``60 / per_minute`` seconds apart."""
+
+    def __init__(self, per_minute: float):
+        self._interval = 60.0 / per_minute
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may make its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class HostRateLimiter:
+    """Thread-safe per-host limiter for polite crawling from many threads.
+
+    Requests to the same host are spaced a random ``min_delay`` to
+    ``max_delay`` seconds apart; requests to different hosts never wait
+    on each other.
+    """
+
+    def __init__(self, min_delay: float, max_delay: float):
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        """Block until a request to *url*'s host is allowed."""
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + random.uniform(
+                self._min_delay, self._max_delay
+            )
+        if slot > now:
+            time.sleep(slot - now)
+
+    def defer(self, url: str, seconds: float) -> None:
+        """Hold back every request to *url*'s host for *seconds* more."""
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            self._next_slot[host] = max(
+                self._next_slot.get(host, 0.0), time.monotonic() + seconds
+            )
@@ -14,19 +14,37 @@ This is best-effort: it will capture what it can from server-rendered HTML
 and known API patterns but won't cover every proprietary ATS.
 """
 import re
-import time
 import random
 import logging
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict, Optional, Tuple
-from urllib.parse import urlparse, urljoin, parse_qs, urlencode
-from bs4 import BeautifulSoup
+from urllib.parse import urlparse, urljoin, urlsplit, parse_qs, urlencode
+import orjson
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
-from .base import BaseSource, JobData
+from ..dedup import canonicalize_url
+from .base import (
+    BaseSource, JobData, HostRateLimiter, TITLE_CATEGORIES,
+    TITLE_EXPERIENCE_LEVELS, first_label, pooled_session,
+)
 
 logger = logging.getLogger(__name__)
 
 
+# Navigation / call-to-action link text that is never a job title
+_GENERIC_LINK_TEXT = frozenset({
+    'apply now', 'learn more', 'read more', 'view all',
+    'see all', 'next', 'previous', 'back', 'home',
+    'sign in', 'log in', 'register', 'search',
+    'filter', 'sort', 'clear', 'reset', 'cookie',
+    'privacy', 'terms', 'contact', 'about',
+})
+
+
 # ── Known ATS platform API patterns ─────────────────────────────────
 # Maps a domain substring → a callable that returns (api_url, parser_func)
 
@@ -53,11 +71,39 @@ class CareerPageSource(BaseSource):
     # Compile once
     JOB_LINK_RE = re.compile('|'.join(JOB_PATH_PATTERNS), re.IGNORECASE)
 
-    # Domains / URL fragments that indicate known ATS platforms
-    WORKDAY_RE = re.compile(r'([\w-]+)\.wd\d?\.myworkdayjobs\.com', re.IGNORECASE)
-    GREENHOUSE_RE = re.compile(r'boards\.greenhouse\.io/([\w-]+)', re.IGNORECASE)
-    LEVER_RE = re.compile(r'jobs\.lever\.co/([\w-]+)', re.IGNORECASE)
-    SMARTRECRUITERS_RE = re.compile(r'careers\.smartrecruiters\.com/([\w-]+)', re.IGNORECASE)
+    # CSS selectors for elements that might contain location; tried in order
+    LOCATION_SELECTORS = (
+        '.location', '.job-location', '[data-location]',
+        '.city', '.region', '[class*="location"]',
+    )
+    # Common card selectors used by career pages
+    CARD_SELECTORS = (
+        '[class*="job-card"]', '[class*="job-item"]',
+        '[class*="job-listing"]', '[class*="vacancy"]',
+        '[class*="position-card"]', '[class*="opening"]',
+        'li[class*="job"]', 'div[class*="result"]',
+        'article', 'tr[class*="job"]',
+    )
+    HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'span'})
+    # Nodes under a link's parent searched for a heading, in document order
+    HEADING_SEARCH_LIMIT = 50
+
+    # Seconds between calls to one ATS JSON API host (Greenhouse, Lever,
+    # SmartRecruiters).  These public APIs are built for programmatic
+    # access, unlike career pages, and every company on a platform shares
+    # the same host – the page-crawl delay would serialise them all.
+    API_REQUEST_DELAY = (0.2, 0.5)
+
+    # Domains / URL fragments that indicate known ATS platforms, as one
+    # alternation scanned once per URL.  Each group is named after its
+    # platform and captures the board / company slug.
+    ATS_RE = re.compile(
+        r'boards\.greenhouse\.io/(?P<greenhouse>[\w-]+)'
+        r'|jobs\.lever\.co/(?P<lever>[\w-]+)'
+        r'|(?P<workday>[\w-]+)\.wd\d?\.myworkdayjobs\.com'
+        r'|careers\.smartrecruiters\.com/(?P<smartrecruiters>[\w-]+)',
+        re.IGNORECASE,
+    )
     TALEO_RE = re.compile(r'([\w-]+)\.taleo\.net', re.IGNORECASE)
 
     USER_AGENTS = [
@@ -75,6 +121,34 @@ class CareerPageSource(BaseSource):
 
     MAX_JOBS_PER_COMPANY = 100  # cap per company to avoid runaway scrapes
 
+    # (connect, read) seconds – a dead host fails fast instead of holding
+    # a worker for the full read timeout on every retry
+    REQUEST_TIMEOUT = (5, 30)
+    # Consecutive failed requests after which a host is skipped for the
+    # rest of the run (circuit breaker)
+    MAX_HOST_FAILURES = 3
+    # HTML beyond this is not read – job links sit well inside it, and
+    # JS-rendered pages (Workday) can run to several MB of script
+    MAX_PAGE_BYTES = 2_000_000
+
+    HTML_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-GB,en;q=0.9',
+    }
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.workers = max(1, int(config.get('CAREER_WORKERS', 8)))
+        # Pages are fetched concurrently; only requests to the same host
+        # are spaced out by the configured delay.
+        self.limiter = HostRateLimiter(
+            config.get('REQUEST_DELAY_MIN', 1.5),
+            config.get('REQUEST_DELAY_MAX', 4.0),
+        )
+        self.api_limiter = HostRateLimiter(*self.API_REQUEST_DELAY)
+        self._host_failures: Dict[str, int] = {}
+        self._host_failures_lock = threading.Lock()
+
     def is_available(self) -> bool:
         return True  # Always available – uses stored career URLs
 
@@ -102,35 +176,71 @@ class CareerPageSource(BaseSource):
             List of JobData objects.
         """
         all_jobs: List[JobData] = []
-        session = requests.Session()
+        entries = [e for e in company_urls if e.get('career_url')]
+        session = pooled_session(pool_size=self.workers, retries=2)
+        self._host_failures.clear()  # give every host a fresh chance per run
 
-        for entry in company_urls:
+        def scrape_entry(entry: Dict[str, str]) -> List[JobData]:
             company = entry['name']
             url = entry['career_url']
-
-            if not url:
-                continue
-
             try:
                 self.logger.info(f"Scraping career page: {company} → {url[:80]}")
                 jobs = self._scrape_one(session, company, url)
                 self.logger.info(f"  → {len(jobs)} jobs from {company}")
-                all_jobs.extend(jobs)
+                return jobs
             except Exception as e:
                 self.logger.error(f"  → Failed for {company}: {e}")
+                return []
 
-            # Respectful delay between companies
-            time.sleep(random.uniform(
-                self.config.get('REQUEST_DELAY_MIN', 1.5),
-                self.config.get('REQUEST_DELAY_MAX', 4.0),
-            ))
+        # map() keeps results in company order, so dedup stays stable
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for jobs in pool.map(scrape_entry, entries):
+                    all_jobs.extend(jobs)
+        finally:
+            session.close()
 
         self.logger.info(
-            f"Career pages total: {len(all_jobs)} jobs from "
-            f"{len([e for e in company_urls if e.get('career_url')])} pages"
+            f"Career pages total: {len(all_jobs)} jobs from {len(entries)} pages"
         )
         return all_jobs
 
+    def _get(
+        self, session: requests.Session, url: str,
+        limiter: Optional[HostRateLimiter] = None, **kwargs,
+    ) -> requests.Response:
+        """``session.get`` after waiting for this host's rate-limit slot.
+
+        Hosts that failed ``MAX_HOST_FAILURES`` times in a row (connection
+        errors, timeouts, 403/429/5xx) are not contacted again this run.
+        """
+        host = urlsplit(url).netloc.lower()
+        if self._host_failures.get(host, 0) >= self.MAX_HOST_FAILURES:
+            raise requests.ConnectionError(f"Skipping {host}: too many failures")
+
+        (limiter or self.limiter).wait(url)
+        try:
+            resp = session.get(url, **kwargs)
+        except requests.RequestException:
+            self._record_host_result(host, failed=True)
+            raise
+        self._record_host_result(
+            host, failed=resp.status_code in (403, 429) or resp.status_code >= 500,
+        )
+        return resp
+
+    def _record_host_result(self, host: str, failed: bool) -> None:
+        with self._host_failures_lock:
+            if not failed:
+                self._host_failures.pop(host, None)
+                return
+            failures = self._host_failures.get(host, 0) + 1
+            self._host_failures[host] = failures
+        if failures == self.MAX_HOST_FAILURES:
+            self.logger.warning(
+                f"{host} failed {failures} times in a row – skipping it this run"
+            )
+
     # ── Per-company scraper ──────────────────────────────────────────
     def _scrape_one(
         self, session: requests.Session, company: str, url: str
@@ -154,28 +264,19 @@ class CareerPageSource(BaseSource):
         self, session: requests.Session, company: str, url: str
     ) -> Optional[List[JobData]]:
         """Detect ATS platform and use its API when possible."""
-
-        # Greenhouse
-        m = self.GREENHOUSE_RE.search(url)
-        if m:
-            return self._scrape_greenhouse(session, company, m.group(1))
-
-        # Lever
-        m = self.LEVER_RE.search(url)
-        if m:
-            return self._scrape_lever(session, company, m.group(1))
-
-        # Workday
-        m = self.WORKDAY_RE.search(url)
-        if m:
+        m = self.ATS_RE.search(url)
+        if not m:
+            return None  # Not a recognized platform
+
+        platform = m.lastgroup
+        slug = m.group(platform)
+        if platform == 'greenhouse':
+            return self._scrape_greenhouse(session, company, slug)
+        if platform == 'lever':
+            return self._scrape_lever(session, company, slug)
+        if platform == 'workday':
             return self._scrape_workday_html(session, company, url)
-
-        # SmartRecruiters
-        m = self.SMARTRECRUITERS_RE.search(url)
-        if m:
-            return self._scrape_smartrecruiters(session, company, m.group(1))
-
-        return None  # Not a recognized platform
+        return self._scrape_smartrecruiters(session, company, slug)
 
     def _scrape_greenhouse(
         self, session: requests.Session, company: str, board_token: str
@@ -183,9 +284,12 @@ class CareerPageSource(BaseSource):
         """Greenhouse exposes a public JSON API."""
         api_url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs"
         try:
-            resp = session.get(api_url, timeout=30, params={"content": "true"})
+            resp = self._get(
+                session, api_url, self.api_limiter,
+                timeout=self.REQUEST_TIMEOUT, params={"content": "true"},
+            )
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
         except Exception as e:
             self.logger.debug(f"Greenhouse API failed for {company}: {e}")
             return []
@@ -214,9 +318,12 @@ class CareerPageSource(BaseSource):
         """Lever exposes listings as JSON when ?mode=json is appended."""
         api_url = f"https://api.lever.co/v0/postings/{company_slug}"
         try:
-            resp = session.get(api_url, timeout=30, params={"mode": "json"})
+            resp = self._get(
+                session, api_url, self.api_limiter,
+                timeout=self.REQUEST_TIMEOUT, params={"mode": "json"},
+            )
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
         except Exception as e:
             self.logger.debug(f"Lever API failed for {company}: {e}")
             return []
@@ -249,9 +356,12 @@ class CareerPageSource(BaseSource):
         """SmartRecruiters has a public API."""
         api_url = f"https://api.smartrecruiters.com/v1/companies/{company_slug}/postings"
         try:
-            resp = session.get(api_url, timeout=30, params={"limit": 100})
+            resp = self._get(
+                session, api_url, self.api_limiter,
+                timeout=self.REQUEST_TIMEOUT, params={"limit": 100},
+            )
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
         except Exception as e:
             self.logger.debug(f"SmartRecruiters API failed for {company}: {e}")
             return []
@@ -287,18 +397,31 @@ class CareerPageSource(BaseSource):
 
     # ── Generic HTML parsing ─────────────────────────────────────────
     def _fetch_page(self, session: requests.Session, url: str) -> Optional[str]:
-        """Fetch a page's HTML content."""
+        """Fetch a page's HTML content, reading at most ``MAX_PAGE_BYTES``."""
         try:
-            session.headers.update({
-                'User-Agent': random.choice(self.USER_AGENTS),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-GB,en;q=0.9',
-            })
-            resp = session.get(url, timeout=30, allow_redirects=True)
-            if resp.status_code != 200:
-                self.logger.debug(f"HTTP {resp.status_code} for {url}")
-                return None
-            return resp.text
+            # Per-request headers – the session is shared across threads
+            headers = {**self.HTML_HEADERS, 'User-Agent': random.choice(self.USER_AGENTS)}
+            with self._get(
+                session, url, timeout=self.REQUEST_TIMEOUT,
+                allow_redirects=True, headers=headers, stream=True,
+            ) as resp:
+                if resp.status_code != 200:
+                    self.logger.debug(f"HTTP {resp.status_code} for {url}")
+                    return None
+
+                chunks = []
+                size = 0
+                for chunk in resp.iter_content(64 * 1024):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= self.MAX_PAGE_BYTES:
+                        self.logger.debug(f"Truncated {url} at {size} bytes")
+                        break
+                # Same charset resp.text would use when the server names
+                # one; skip its slow charset sniffing when it doesn't
+                return b''.join(chunks).decode(
+                    resp.encoding or 'utf-8', errors='replace'
+                )
         except requests.RequestException as e:
             self.logger.debug(f"Request failed for {url}: {e}")
             return None
@@ -309,21 +432,29 @@ class CareerPageSource(BaseSource):
         """
         Generic HTML parser: finds links that look like individual job postings
         by checking href patterns and link text.
+
+        Uses selectolax's Lexbor parser: the tree is built in C without a
+        Python object per node, which is most of the cost of parsing a
+        page with BeautifulSoup – and pages are parsed on several threads.
         """
-        soup = BeautifulSoup(html, 'lxml')
+        tree = LexborHTMLParser(html)
+        # Canonical URLs, so tracking params, case and trailing slashes
+        # don't let the same posting through twice
         seen_urls = set()
         jobs = []
 
         # Strategy 1: Links matching job path patterns
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-            full_url = urljoin(base_url, href)
+        for a_tag in tree.css('a[href]'):
+            href = a_tag.attributes.get('href') or ''
 
-            if full_url in seen_urls:
+            # Must look like a job link – checked before the costlier
+            # urljoin, since most links on a page are navigation
+            if not self.JOB_LINK_RE.search(href):
                 continue
 
-            # Must look like a job link
-            if not self.JOB_LINK_RE.search(href):
+            full_url = urljoin(base_url, href)
+            key = canonicalize_url(full_url)
+            if key in seen_urls:
                 continue
 
             # Extract title from link text or nearest heading
@@ -335,7 +466,7 @@ class CareerPageSource(BaseSource):
             if self._is_generic_link(title):
                 continue
 
-            seen_urls.add(full_url)
+            seen_urls.add(key)
             location = self._extract_location_near(a_tag) or 'United Kingdom'
 
             jobs.append(JobData(
@@ -351,34 +482,38 @@ class CareerPageSource(BaseSource):
 
         # Strategy 2: Look for structured job cards (common patterns)
         if not jobs:
-            jobs = self._parse_job_cards(soup, base_url, company)
+            jobs = self._parse_job_cards(tree, base_url, company)
 
         return jobs
 
-    def _extract_title_from_link(self, a_tag) -> Optional[str]:
+    def _extract_title_from_link(self, a_tag: LexborNode) -> Optional[str]:
         """Get job title from the link text or nearby elements."""
-        text = a_tag.get_text(strip=True)
+        text = a_tag.text(strip=True)
         if text and len(text) >= 5:
             return text
 
         # Check for title/aria-label attributes
         for attr in ['title', 'aria-label']:
-            val = a_tag.get(attr, '')
+            val = a_tag.attributes.get(attr) or ''
             if val and len(val) >= 5:
                 return val.strip()
 
-        # Check parent or sibling heading
+        # Check parent or sibling heading.  The walk is bounded: a heading
+        # far outside the link's own card isn't its title, and scanning a
+        # large shared container once per link would be quadratic.
         parent = a_tag.parent
         if parent:
-            heading = parent.find(['h1', 'h2', 'h3', 'h4', 'h5', 'span'])
-            if heading:
-                text = heading.get_text(strip=True)
-                if text and len(text) >= 5:
-                    return text
+            nodes = islice(parent.traverse(), 1, self.HEADING_SEARCH_LIMIT + 1)
+            for node in nodes:
+                if node.tag in self.HEADING_TAGS:
+                    text = node.text(strip=True)
+                    if text and len(text) >= 5:
+                        return text
+                    break
 
         return None
 
-    def _extract_location_near(self, a_tag) -> Optional[str]:
+    def _extract_location_near(self, a_tag: LexborNode) -> Optional[str]:
         """Try to find a location string near the job link."""
         # Check parent container for location-like text
         parent = a_tag.parent
@@ -389,51 +524,42 @@ class CareerPageSource(BaseSource):
             return None
 
         # Look for elements that might contain location
-        for sel in ['.location', '.job-location', '[data-location]',
-                     '.city', '.region', '[class*="location"]']:
-            loc_el = parent.select_one(sel)
+        for sel in self.LOCATION_SELECTORS:
+            loc_el = parent.css_first(sel)
             if loc_el:
-                text = loc_el.get_text(strip=True)
+                text = loc_el.text(strip=True)
                 if text:
                     return text
 
         return None
 
     def _parse_job_cards(
-        self, soup: BeautifulSoup, base_url: str, company: str
+        self, tree: LexborHTMLParser, base_url: str, company: str
     ) -> List[JobData]:
         """Look for repeated card-like structures containing job info."""
         jobs = []
         seen = set()
 
-        # Common card selectors used by career pages
-        card_selectors = [
-            '[class*="job-card"]', '[class*="job-item"]',
-            '[class*="job-listing"]', '[class*="vacancy"]',
-            '[class*="position-card"]', '[class*="opening"]',
-            'li[class*="job"]', 'div[class*="result"]',
-            'article', 'tr[class*="job"]',
-        ]
-
-        for selector in card_selectors:
-            cards = soup.select(selector)
+        for selector in self.CARD_SELECTORS:
+            cards = tree.css(selector)
             if len(cards) < 2:
                 continue  # Needs multiple to be a list
 
             for card in cards:
-                link = card.find('a', href=True)
+                link = card.css_first('a[href]')
                 if not link:
                     continue
 
-                full_url = urljoin(base_url, link['href'])
-                if full_url in seen:
+                full_url = urljoin(base_url, link.attributes.get('href') or '')
+                key = canonicalize_url(full_url)
+                if key in seen:
                     continue
 
                 title = self._extract_title_from_link(link)
                 if not title or len(title) < 5 or self._is_generic_link(title):
                     continue
 
-                seen.add(full_url)
+                seen.add(key)
                 location = self._extract_location_near(link) or 'United Kingdom'
 
                 jobs.append(JobData(
@@ -455,65 +581,22 @@ class CareerPageSource(BaseSource):
     @staticmethod
     def _is_generic_link(text: str) -> bool:
         """Check if link text is generic (not a job title)."""
-        generic = [
-            'apply now', 'learn more', 'read more', 'view all',
-            'see all', 'next', 'previous', 'back', 'home',
-            'sign in', 'log in', 'register', 'search',
-            'filter', 'sort', 'clear', 'reset', 'cookie',
-            'privacy', 'terms', 'contact', 'about',
-        ]
         lower = text.lower().strip()
-        return lower in generic or len(lower) < 4
+        return len(lower) < 4 or lower in _GENERIC_LINK_TEXT
 
     # ── Guessers (shared with google_search logic) ───────────────────
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _guess_experience(title: str) -> Optional[str]:
-        t = title.lower()
-        if any(k in t for k in ("senior", "sr.", "sr ", "lead", "principal", "staff")):
-            return "Senior Level"
-        if any(k in t for k in ("junior", "jr.", "jr ", "entry", "graduate", "trainee", "intern", "apprentice")):
-            return "Entry Level"
-        if any(k in t for k in ("mid", "intermediate")):
-            return "Mid Level"
-        if any(k in t for k in ("director", "head of", "vp ", "vice president", "chief", "cto", "cfo")):
-            return "Director / Executive"
-        if "manager" in t:
-            return "Manager"
-        return None
+        return first_label(TITLE_EXPERIENCE_LEVELS, title.lower())
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _guess_category(title: str) -> Optional[str]:
-        t = title.lower()
-        mapping = [
-            (["software", "developer", "engineer", "frontend", "backend",
-              "full-stack", "fullstack", "devops", "sre", "platform"],
-             "Technology"),
-            (["data scientist", "data engineer", "data analyst",
-              "machine learning", "ai ", "artificial intelligence", "ml "],
-             "Data & AI"),
-            (["product manager", "product owner", "product lead"], "Product"),
-            (["designer", "ux", "ui", "design"], "Design"),
-            (["finance", "accountant", "auditor", "actuary", "tax",
-              "investment", "banking"], "Finance"),
-            (["solicitor", "lawyer", "legal", "paralegal", "barrister"], "Legal"),
-            (["consultant", "consulting", "advisory"], "Consulting"),
-            (["marketing", "seo", "content", "brand"], "Marketing"),
-            (["sales", "business development", "account executive"], "Sales"),
-            (["nurse", "doctor", "clinical", "medical", "healthcare", "nhs"],
-             "Healthcare"),
-            (["mechanical", "electrical", "civil", "structural", "chemical"],
-             "Engineering"),
-            (["cyber", "security", "infosec", "penetration"], "Cybersecurity"),
-            (["project manager", "programme manager", "scrum", "delivery"],
-             "Project Management"),
-            (["analyst", "research", "quantitative"], "Research & Analysis"),
-        ]
-        for keywords, category in mapping:
-            if any(k in t for k in keywords):
-                return category
-        return None
+        return first_label(TITLE_CATEGORIES, title.lower())
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _guess_job_type(text: str) -> Optional[str]:
         t = text.lower()
         parts = []
@@ -7,7 +7,9 @@ API endpoint: https://devitjobs.uk/api/jobsLight
 """
 import requests
 import logging
+from functools import lru_cache
 from typing import List, Optional
+import orjson
 from .base import BaseSource, JobData
 
 
@@ -17,6 +19,13 @@ class DevITJobsSource(BaseSource):
     name = "devitjobs"
     API_URL = "https://devitjobs.uk/api/jobsLight"
 
+    EXPERIENCE_LEVELS = {
+        "Junior": "Entry Level",
+        "Regular": "Mid Level",
+        "Senior": "Senior Level",
+        "Lead": "Lead / Principal",
+    }
+
     def is_available(self) -> bool:
         return True  # Always available
 
@@ -33,7 +42,9 @@ class DevITJobsSource(BaseSource):
                 headers={"Accept": "application/json"},
             )
             resp.raise_for_status()
-            data = resp.json()
+            # Several MB of JSON: orjson parses the bytes directly, skipping
+            # the text decode and building the list several times faster
+            data = orjson.loads(resp.content)
 
             if not isinstance(data, list):
                 self.logger.error("Unexpected response format from DevITjobs")
@@ -65,25 +76,20 @@ class DevITJobsSource(BaseSource):
     ) -> Optional[JobData]:
         title = (item.get("name") or "").strip()
         company = (item.get("company") or "").strip()
+        # Every field JobData.is_valid() needs is checked before any other
+        # work; the location always ends in "UK", so is never empty
         if not title or not company:
             return None
 
-        # Build location from city + workplace type
-        city = (item.get("actualCity") or "").strip()
-        workplace = (item.get("workplace") or "").strip()
-        location_parts = []
-        if city:
-            location_parts.append(city)
-        if workplace:
-            location_parts.append(workplace.capitalize())
-        location_parts.append("UK")
-        location = ", ".join(location_parts)
-
         # Build full URL from slug
         slug = item.get("jobUrl", "")
-        url = f"https://devitjobs.uk/jobs/{slug}" if slug else ""
-        if not url:
+        if not slug:
             return None
+        url = f"https://devitjobs.uk/jobs/{slug}"
+
+        city = (item.get("actualCity") or "").strip()
+        workplace = (item.get("workplace") or "").strip()
+        location = self._location(city, workplace)
 
         # Salary info
         salary_from = item.get("annualSalaryFrom")
@@ -96,13 +102,7 @@ class DevITJobsSource(BaseSource):
 
         # Experience level
         exp = item.get("expLevel", "")
-        exp_map = {
-            "Junior": "Entry Level",
-            "Regular": "Mid Level",
-            "Senior": "Senior Level",
-            "Lead": "Lead / Principal",
-        }
-        experience_level = exp_map.get(exp, exp if exp else None)
+        experience_level = self.EXPERIENCE_LEVELS.get(exp, exp if exp else None)
 
         # Technologies as category
         techs = item.get("technologies", [])
@@ -126,3 +126,15 @@ class DevITJobsSource(BaseSource):
             experience_level=experience_level,
             job_type=job_type_raw,
         )
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _location(city: str, workplace: str) -> str:
+        """Location from city + workplace type – a few hundred distinct pairs."""
+        location_parts = []
+        if city:
+            location_parts.append(city)
+        if workplace:
+            location_parts.append(workplace.capitalize())
+        location_parts.append("UK")
+        return ", ".join(location_parts)
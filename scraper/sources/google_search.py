@@ -7,14 +7,24 @@ This effectively "scrapes the web" – every job board, career page, LinkedIn
 listing, and recruitment site indexed by the search engine is a potential hit.
 """
 import requests
-import time
+import gzip
+import hashlib
+import os
 import random
 import re
+import sys
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional, Dict, Tuple
-from urllib.parse import urlparse, parse_qs, unquote
-from bs4 import BeautifulSoup
-from .base import BaseSource, JobData
+from urllib.parse import urlparse, unquote, unquote_plus
+from selectolax.lexbor import LexborHTMLParser
+from .base import (
+    BaseSource, JobData, HostRateLimiter, TITLE_CATEGORIES,
+    TITLE_EXPERIENCE_LEVELS, first_label, pooled_session,
+)
 
 
 class GoogleSearchSource(BaseSource):
@@ -83,6 +93,80 @@ class GoogleSearchSource(BaseSource):
 
     COMPANY_BATCH_SIZE = 3
     MAX_QUERIES = 70
+    MAX_CONSECUTIVE_FAILURES = 5
+
+    # Queries in flight at once.  Starts are still spaced QUERY_DELAY
+    # apart – DuckDuckGo rate-limits quickly – but a slow response no
+    # longer holds up the next query on top of that delay.
+    SEARCH_WORKERS = 4
+    QUERY_DELAY = (3.0, 6.0)
+
+    # Titles of listing / article pages rather than individual jobs
+    SEARCH_PAGE_RE = re.compile(
+        r"\d[\d,]+\+?\s+(jobs?|vacancies|positions|results)"
+        r"|jobs?\s+in\s+(united kingdom|uk|london|manchester|birmingham)"
+        r"|^(search|find|browse)\s+"
+        r"|\|\s*(reed|indeed|glassdoor|totaljobs|linkedin)\s*$"
+        r"|\bhow\s+(to|ai|is)\b"     # Blog posts ("How to...", "How AI is...")
+        r"|\btop\s+\d+\s+"            # Listicles ("Top 10...")
+        r"|\bguide\b"                  # Guides
+        r"|\btips\b"                   # Tips articles
+        r"|\bsalary\b.*\bguide\b"     # Salary guides
+        r"|\bbest\s+(companies|employers|places)\b",
+        re.IGNORECASE,
+    )
+    # Target of DuckDuckGo's redirect wrapper ("//duckduckgo.com/l/?uddg=…"):
+    # the first non-empty uddg field of the query string
+    UDDG_RE = re.compile(r"[^?]*\?(?:[^&]*&)*?uddg=([^&]+)")
+    # Job-board tags removed from result titles wherever they appear
+    BOARD_TAG_RE = re.compile("|".join(map(re.escape, (
+        "| LinkedIn", "- LinkedIn", "| Indeed", "- Indeed",
+        "| Glassdoor", "- Glassdoor", "| Reed", "- Reed",
+        "| Totaljobs", "- Totaljobs", "| CV-Library",
+        "| Workable", "| Lever", "| Greenhouse",
+        "| Find a Job", "- Find a Job", "| CWJobs",
+    ))))
+    AT_COMPANY_RE = re.compile(r"\bat\s+(.+?)$", re.IGNORECASE)
+    TRAILING_SEPS = ("-", "|", "–", "—")
+    TRAILING_SEP_RE = re.compile(r"\s*[-|–—]\s*$")
+
+    # Stripped one after another, in this order
+    COMPANY_SUFFIXES = (
+        "Careers", "Jobs", "Hiring", "Vacancies",
+        "careers", "jobs", "hiring", "vacancies",
+        "LinkedIn", "Indeed", "Glassdoor", "Reed",
+        "UK", "Ltd", "Limited", "PLC", "plc", "Inc",
+    )
+    COMPANY_SUFFIX_RES = [
+        re.compile(rf"\s*\b{re.escape(s)}\s*$") for s in COMPANY_SUFFIXES
+    ]
+
+    UK_CITIES = (
+        "London", "Manchester", "Birmingham", "Leeds", "Glasgow",
+        "Liverpool", "Edinburgh", "Bristol", "Sheffield", "Newcastle",
+        "Nottingham", "Southampton", "Cardiff", "Belfast", "Leicester",
+        "Coventry", "Reading", "Cambridge", "Oxford", "Brighton",
+        "York", "Aberdeen", "Bath", "Dundee", "Exeter", "Norwich",
+        "Plymouth", "Derby", "Swansea", "Portsmouth", "Warwick",
+        "Milton Keynes", "Swindon", "Guildford", "Cheltenham",
+        "Canary Wharf", "Slough", "Luton", "Croydon", "Watford",
+    )
+    # One scan for every city: group i+1 captures UK_CITIES[i], so a
+    # match's lastindex says which city it was.  No city contains another
+    # as a whole word, so non-overlapping matches miss nothing.
+    CITY_RE = re.compile(
+        r"\b(?:" + "|".join(f"({re.escape(city)})" for city in UK_CITIES) + r")\b",
+        re.IGNORECASE,
+    )
+    UNITED_KINGDOM_RE = re.compile(r"\bUnited Kingdom\b", re.IGNORECASE)
+    REMOTE_RE = re.compile(r"\bRemote\b", re.IGNORECASE)
+    HYBRID_RE = re.compile(r"\bHybrid\b", re.IGNORECASE)
+    UK_RE = re.compile(r"\b(UK|U\.K\.)\b")
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.cache_dir = config.get('SEARCH_CACHE_DIR')
+        self.cache_ttl = config.get('SEARCH_CACHE_TTL', 0)
 
     # ──────────────────────────────────────────────────────────────
     def is_available(self) -> bool:
@@ -91,59 +175,80 @@ class GoogleSearchSource(BaseSource):
     def scrape(
         self, companies: List[str], general_queries: List[str]
     ) -> List[JobData]:
-        queries = self._build_queries(companies, general_queries)
+        queries = self._build_queries(companies, general_queries)[: self.MAX_QUERIES]
         jobs: List[JobData] = []
         seen_urls: set = set()
 
-        session = requests.Session()
+        # Keep-alive across queries; 429/5xx retried with backoff.  202 is
+        # DuckDuckGo's rate-limit signal and is handled in _search, which
+        # holds back every worker rather than just the one that got it.
+        session = pooled_session(pool_size=self.SEARCH_WORKERS, retries=2)
+        limiter = HostRateLimiter(*self.QUERY_DELAY)
+        lock = threading.Lock()
         consecutive_failures = 0
+        self._prune_cache()
 
-        for idx, query in enumerate(queries[: self.MAX_QUERIES]):
-            if consecutive_failures >= 5:
-                self.logger.warning(
-                    f"Stopping web search after {consecutive_failures} "
-                    f"consecutive failures ({len(jobs)} jobs found so far)"
-                )
-                break
-
-            session.headers.update({
-                "User-Agent": random.choice(self.USER_AGENTS),
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-GB,en;q=0.9",
-                "Referer": "https://html.duckduckgo.com/",
-            })
+        def run_query(query: str) -> Optional[List[Dict]]:
+            nonlocal consecutive_failures
 
-            try:
-                results = self._search(session, query)
+            # A fresh cached page costs no request and no rate-limit slot
+            html = self._cached_page(query)
+            if html is not None:
+                return self._parse_results(html)
 
-                if results is None:
-                    consecutive_failures += 1
-                    time.sleep(random.uniform(5, 10))
-                    continue
-
-                consecutive_failures = 0
-                batch_new = 0
-
-                for r in results:
-                    if r["url"] in seen_urls:
-                        continue
-                    job = self._result_to_job(r)
-                    if job and job.is_valid():
-                        seen_urls.add(r["url"])
-                        jobs.append(job)
-                        batch_new += 1
-
-                self.logger.info(
-                    f"Query {idx+1}/{min(len(queries), self.MAX_QUERIES)}: "
-                    f"{len(results)} results, {batch_new} new jobs | {query[:70]}"
-                )
+            def given_up() -> bool:
+                return consecutive_failures >= self.MAX_CONSECUTIVE_FAILURES
 
+            # Checked again after the wait: the run may have stopped meanwhile
+            if given_up():
+                return None
+            limiter.wait(self.SEARCH_URL)
+            if given_up():
+                return None
+            try:
+                results = self._search(session, limiter, query)
             except Exception as e:
                 self.logger.error(f"Search error: {e}")
+                results = None
+
+            with lock:
+                if results is not None:
+                    consecutive_failures = 0
+                    return results
                 consecutive_failures += 1
+                if consecutive_failures == self.MAX_CONSECUTIVE_FAILURES:
+                    self.logger.warning(
+                        f"Stopping web search after {consecutive_failures} "
+                        f"consecutive failures"
+                    )
+            # Back off before anyone queries DuckDuckGo again
+            limiter.defer(self.SEARCH_URL, random.uniform(5, 10))
+            return None
+
+        # map() keeps results in query order, so dedup stays stable
+        try:
+            with ThreadPoolExecutor(max_workers=self.SEARCH_WORKERS) as pool:
+                batches = pool.map(run_query, queries)
+                for idx, (query, results) in enumerate(zip(queries, batches)):
+                    if results is None:
+                        continue
 
-            # Respectful delay – DuckDuckGo rate-limits quickly
-            time.sleep(random.uniform(3.0, 6.0))
+                    batch_new = 0
+                    for r in results:
+                        if r["url"] in seen_urls:
+                            continue
+                        job = self._result_to_job(r)
+                        if job and job.is_valid():
+                            seen_urls.add(r["url"])
+                            jobs.append(job)
+                            batch_new += 1
+
+                    self.logger.info(
+                        f"Query {idx+1}/{len(queries)}: "
+                        f"{len(results)} results, {batch_new} new jobs | {query[:70]}"
+                    )
+        finally:
+            session.close()
 
         self.logger.info(f"Web search total: {len(jobs)} jobs extracted")
         return jobs
@@ -183,12 +288,20 @@ class GoogleSearchSource(BaseSource):
 
     # ── HTTP fetch ───────────────────────────────────────────────
     def _search(
-        self, session: requests.Session, query: str
+        self, session: requests.Session, limiter: HostRateLimiter, query: str
     ) -> Optional[List[Dict]]:
+        # Per-request headers: the session is shared between threads
+        headers = {
+            "User-Agent": random.choice(self.USER_AGENTS),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-GB,en;q=0.9",
+            "Referer": "https://html.duckduckgo.com/",
+        }
         try:
             resp = session.get(
                 self.SEARCH_URL,
                 params={"q": query},
+                headers=headers,
                 timeout=30,
             )
         except requests.RequestException as e:
@@ -196,13 +309,15 @@ class GoogleSearchSource(BaseSource):
             return None
 
         if resp.status_code == 202:
-            # DuckDuckGo rate limit – wait and retry once
+            # DuckDuckGo rate limit – hold back every worker, then retry once
             self.logger.info("Rate limited (202) – waiting before retry…")
-            time.sleep(random.uniform(15, 25))
+            limiter.defer(self.SEARCH_URL, random.uniform(15, 25))
+            limiter.wait(self.SEARCH_URL)
             try:
                 resp = session.get(
                     self.SEARCH_URL,
                     params={"q": query},
+                    headers=headers,
                     timeout=30,
                 )
                 if resp.status_code != 200:
@@ -215,36 +330,83 @@ class GoogleSearchSource(BaseSource):
             self.logger.warning(f"HTTP {resp.status_code}")
             return None
 
+        self._cache_page(query, resp.text)
         return self._parse_results(resp.text)
 
+    # ── Result-page cache ────────────────────────────────────────
+    def _cache_path(self, query: str) -> str:
+        digest = hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.html.gz")
+
+    def _cached_page(self, query: str) -> Optional[str]:
+        """HTML stored for *query* within the last ``cache_ttl`` seconds."""
+        if not self.cache_dir or self.cache_ttl <= 0:
+            return None
+        path = self._cache_path(query)
+        try:
+            if time.time() - os.path.getmtime(path) > self.cache_ttl:
+                return None
+            with open(path, "rb") as f:
+                return gzip.decompress(f.read()).decode("utf-8")
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None  # missing, or half-written by a crashed run
+
+    def _cache_page(self, query: str, html: str) -> None:
+        if not self.cache_dir or self.cache_ttl <= 0:
+            return
+        path = self._cache_path(query)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(html.encode("utf-8")))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.debug(f"Could not cache results page: {e}")
+
+    def _prune_cache(self) -> None:
+        """Delete expired pages so queries that are no longer run don't pile up."""
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return
+        cutoff = time.time() - max(self.cache_ttl, 0)
+        for entry in os.scandir(self.cache_dir):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
     # ── Result parser ────────────────────────────────────────────
     def _parse_results(self, html: str) -> List[Dict]:
-        soup = BeautifulSoup(html, "lxml")
+        # Lexbor builds the tree and matches selectors in C – BeautifulSoup's
+        # Python-level tree was most of the per-query CPU cost
+        tree = LexborHTMLParser(html)
         results: List[Dict] = []
 
-        for result_div in soup.select(".result"):
-            title_el = result_div.select_one(".result__a")
-            snippet_el = result_div.select_one(".result__snippet")
+        for result_div in tree.css(".result"):
+            title_el = result_div.css_first(".result__a")
+            snippet_el = result_div.css_first(".result__snippet")
 
             if not title_el:
                 continue
 
-            title = title_el.get_text(strip=True)
-            raw_href = title_el.get("href", "")
+            title = title_el.text(strip=True)
+            raw_href = title_el.attributes.get("href") or ""
             url = self._unwrap_ddg_url(raw_href)
 
             if not url:
                 continue
 
             try:
-                domain = urlparse(url).netloc.lower().replace("www.", "")
+                # A few dozen domains recur across hundreds of results
+                domain = sys.intern(urlparse(url).netloc.lower().replace("www.", ""))
             except Exception:
                 continue
 
-            if any(skip in domain for skip in self.SKIP_DOMAINS):
+            if self._is_skipped_domain(domain):
                 continue
 
-            snippet = snippet_el.get_text(strip=True) if snippet_el else ""
+            snippet = snippet_el.text(strip=True) if snippet_el else ""
 
             results.append({
                 "title": title,
@@ -255,17 +417,22 @@ class GoogleSearchSource(BaseSource):
 
         return results
 
-    @staticmethod
-    def _unwrap_ddg_url(href: str) -> Optional[str]:
+    def _is_skipped_domain(self, domain: str) -> bool:
+        # The domain or any parent of it ("en.wikipedia.org" → "wikipedia.org")
+        while domain:
+            if domain in self.SKIP_DOMAINS:
+                return True
+            domain = domain.partition(".")[2]
+        return False
+
+    @classmethod
+    def _unwrap_ddg_url(cls, href: str) -> Optional[str]:
         """Extract the real URL from DuckDuckGo's redirect wrapper."""
-        if "uddg=" in href:
-            try:
-                qs = parse_qs(href.split("?", 1)[1]) if "?" in href else {}
-                urls = qs.get("uddg", [])
-                if urls:
-                    return unquote(urls[0])
-            except Exception:
-                pass
+        m = cls.UDDG_RE.match(href)
+        if m:
+            # Decoded twice, as parse_qs + unquote did, so stored URLs
+            # (and their dedup hashes) don't change
+            return unquote(unquote_plus(m.group(1)))
         if href.startswith("http") and "duckduckgo" not in href:
             return href
         return None
@@ -277,23 +444,26 @@ class GoogleSearchSource(BaseSource):
         snippet = result.get("snippet", "")
         domain = result.get("domain", "")
 
+        # Cheapest rejections first; location is only extracted for keepers
         company = self._extract_company(raw_title, url, domain)
-        location = self._extract_location(raw_title, snippet)
+        if not company or company.lower() in ("jobs", "careers", "hiring", "search"):
+            return None
+
         clean_title = self._clean_title(raw_title, company, domain)
+        if not clean_title or len(clean_title) < 4:
+            return None
 
         # Reject generic search-result pages (e.g. "1,234 Software Engineer jobs")
         if self._is_search_results_page(clean_title):
             return None
 
-        if not clean_title or len(clean_title) < 4:
-            return None
-        if not company or company.lower() in ("jobs", "careers", "hiring", "search"):
-            return None
+        location = self._extract_location(raw_title, snippet)
 
+        # Companies and locations repeat across results; share one copy of each
         return JobData(
             title=clean_title,
-            company=company,
-            location=location or "United Kingdom",
+            company=sys.intern(company),
+            location=sys.intern(location) if location else "United Kingdom",
             url=url,
             source="google_search",
             category=self._guess_category(clean_title),
@@ -301,26 +471,9 @@ class GoogleSearchSource(BaseSource):
             job_type=self._guess_job_type(clean_title + " " + snippet),
         )
 
-    @staticmethod
-    def _is_search_results_page(title: str) -> bool:
+    def _is_search_results_page(self, title: str) -> bool:
         """Detect pages that aren't individual job listings."""
-        patterns = [
-            r"\d[\d,]+\+?\s+(jobs?|vacancies|positions|results)",
-            r"jobs?\s+in\s+(united kingdom|uk|london|manchester|birmingham)",
-            r"^(search|find|browse)\s+",
-            r"\|\s*(reed|indeed|glassdoor|totaljobs|linkedin)\s*$",
-            r"\bhow\s+(to|ai|is)\b",     # Blog posts ("How to...", "How AI is...")
-            r"\btop\s+\d+\s+",            # Listicles ("Top 10...")
-            r"\bguide\b",                  # Guides
-            r"\btips\b",                   # Tips articles
-            r"\bsalary\b.*\bguide\b",     # Salary guides
-            r"\bbest\s+(companies|employers|places)\b",
-        ]
-        t = title.lower()
-        for p in patterns:
-            if re.search(p, t, re.IGNORECASE):
-                return True
-        return False
+        return self.SEARCH_PAGE_RE.search(title.lower()) is not None
 
     # ── Company extraction ───────────────────────────────────────
     def _extract_company(
@@ -342,7 +495,7 @@ class GoogleSearchSource(BaseSource):
                     return candidate
 
         # "... at Company"
-        m = re.search(r"\bat\s+(.+?)$", title, re.IGNORECASE)
+        m = self.AT_COMPANY_RE.search(title)
         if m:
             candidate = self._strip_suffixes(m.group(1).strip())
             if len(candidate) > 2:
@@ -371,128 +524,76 @@ class GoogleSearchSource(BaseSource):
                 if 2 < len(candidate) < 80:
                     return candidate
 
-        m = re.search(r"\bat\s+(.+?)$", cleaned, re.IGNORECASE)
+        m = self.AT_COMPANY_RE.search(cleaned)
         if m:
             return self._strip_suffixes(m.group(1).strip())
 
         return ""
 
-    @staticmethod
-    def _strip_suffixes(name: str) -> str:
-        for s in [
-            "Careers", "Jobs", "Hiring", "Vacancies",
-            "careers", "jobs", "hiring", "vacancies",
-            "LinkedIn", "Indeed", "Glassdoor", "Reed",
-            "UK", "Ltd", "Limited", "PLC", "plc", "Inc",
-        ]:
-            name = re.sub(rf"\s*\b{re.escape(s)}\s*$", "", name).strip()
+    def _strip_suffixes(self, name: str) -> str:
+        # Most names end in none of the suffixes: skip the 18 regex passes
+        stripped = name.strip()
+        if not stripped.endswith(self.COMPANY_SUFFIXES):
+            return stripped
+        for suffix_re in self.COMPANY_SUFFIX_RES:
+            name = suffix_re.sub("", name).strip()
         return name
 
-    def _job_board_for_domain(self, domain: str) -> Optional[str]:
-        for pattern, board in self.JOB_BOARDS.items():
-            if pattern in domain:
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _job_board_for_domain(cls, domain: str) -> Optional[str]:
+        # Try the domain, then each parent ("uk.indeed.com" → "indeed.com").
+        # Memoised: a few dozen domains supply most results.
+        while domain:
+            board = cls.JOB_BOARDS.get(domain)
+            if board:
                 return board
+            domain = domain.partition(".")[2]
         return None
 
     # ── Location extraction ──────────────────────────────────────
-    @staticmethod
-    def _extract_location(title: str, snippet: str) -> Optional[str]:
+    def _extract_location(self, title: str, snippet: str) -> Optional[str]:
         text = f"{title} {snippet}"
-        uk_cities = [
-            "London", "Manchester", "Birmingham", "Leeds", "Glasgow",
-            "Liverpool", "Edinburgh", "Bristol", "Sheffield", "Newcastle",
-            "Nottingham", "Southampton", "Cardiff", "Belfast", "Leicester",
-            "Coventry", "Reading", "Cambridge", "Oxford", "Brighton",
-            "York", "Aberdeen", "Bath", "Dundee", "Exeter", "Norwich",
-            "Plymouth", "Derby", "Swansea", "Portsmouth", "Warwick",
-            "Milton Keynes", "Swindon", "Guildford", "Cheltenham",
-            "Canary Wharf", "Slough", "Luton", "Croydon", "Watford",
-        ]
-        found = []
-        for city in uk_cities:
-            if re.search(r"\b" + re.escape(city) + r"\b", text, re.IGNORECASE):
-                found.append(city)
+        # Report cities in UK_CITIES order, not the order they appear in
+        found = sorted({m.lastindex for m in self.CITY_RE.finditer(text)})
         if found:
-            return ", ".join(found[:2]) + ", UK"
+            return ", ".join(self.UK_CITIES[i - 1] for i in found[:2]) + ", UK"
 
-        if re.search(r"\bUnited Kingdom\b", text, re.IGNORECASE):
+        if self.UNITED_KINGDOM_RE.search(text):
             return "United Kingdom"
-        if re.search(r"\bRemote\b", text, re.IGNORECASE):
+        if self.REMOTE_RE.search(text):
             return "Remote, UK"
-        if re.search(r"\bHybrid\b", text, re.IGNORECASE):
+        if self.HYBRID_RE.search(text):
             return "Hybrid, UK"
-        if re.search(r"\b(UK|U\.K\.)\b", text):
+        if self.UK_RE.search(text):
             return "United Kingdom"
 
         return None
 
     # ── Title cleaning ───────────────────────────────────────────
     def _clean_title(self, title: str, company: str, domain: str) -> str:
-        cleaned = title
-        for tag in [
-            "| LinkedIn", "- LinkedIn", "| Indeed", "- Indeed",
-            "| Glassdoor", "- Glassdoor", "| Reed", "- Reed",
-            "| Totaljobs", "- Totaljobs", "| CV-Library",
-            "| Workable", "| Lever", "| Greenhouse",
-            "| Find a Job", "- Find a Job", "| CWJobs",
-        ]:
-            cleaned = cleaned.replace(tag, "").strip()
+        cleaned = self.BOARD_TAG_RE.sub("", title).strip()
 
         if company:
             for sep in [" - ", " | ", " – ", " — ", " at ", " @ "]:
                 pattern = re.escape(sep) + re.escape(company) + r"\s*$"
                 cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
 
-        cleaned = re.sub(r"\s*[-|–—]\s*$", "", cleaned).strip()
+        cleaned = cleaned.strip()
+        if cleaned.endswith(self.TRAILING_SEPS):
+            cleaned = self.TRAILING_SEP_RE.sub("", cleaned).strip()
         return cleaned
 
     # ── Guessers ─────────────────────────────────────────────────
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _guess_experience(title: str) -> Optional[str]:
-        t = title.lower()
-        if any(k in t for k in ("senior", "sr.", "sr ", "lead", "principal", "staff")):
-            return "Senior Level"
-        if any(k in t for k in ("junior", "jr.", "jr ", "entry", "graduate", "trainee", "intern", "apprentice")):
-            return "Entry Level"
-        if any(k in t for k in ("mid", "intermediate")):
-            return "Mid Level"
-        if any(k in t for k in ("director", "head of", "vp ", "vice president", "chief", "cto", "cfo")):
-            return "Director / Executive"
-        if "manager" in t:
-            return "Manager"
-        return None
+        return first_label(TITLE_EXPERIENCE_LEVELS, title.lower())
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _guess_category(title: str) -> Optional[str]:
-        t = title.lower()
-        mapping = [
-            (["software", "developer", "engineer", "frontend", "backend",
-              "full-stack", "fullstack", "devops", "sre", "platform"],
-             "Technology"),
-            (["data scientist", "data engineer", "data analyst",
-              "machine learning", "ai ", "artificial intelligence", "ml "],
-             "Data & AI"),
-            (["product manager", "product owner", "product lead"], "Product"),
-            (["designer", "ux", "ui", "design"], "Design"),
-            (["finance", "accountant", "auditor", "actuary", "tax",
-              "investment", "banking"], "Finance"),
-            (["solicitor", "lawyer", "legal", "paralegal", "barrister"], "Legal"),
-            (["consultant", "consulting", "advisory"], "Consulting"),
-            (["marketing", "seo", "content", "brand"], "Marketing"),
-            (["sales", "business development", "account executive"], "Sales"),
-            (["nurse", "doctor", "clinical", "medical", "healthcare", "nhs"],
-             "Healthcare"),
-            (["mechanical", "electrical", "civil", "structural", "chemical"],
-             "Engineering"),
-            (["cyber", "security", "infosec", "penetration"], "Cybersecurity"),
-            (["project manager", "programme manager", "scrum", "delivery"],
-             "Project Management"),
-            (["analyst", "research", "quantitative"], "Research & Analysis"),
-        ]
-        for keywords, category in mapping:
-            if any(k in t for k in keywords):
-                return category
-        return None
+        return first_label(TITLE_CATEGORIES, title.lower())
 
     @staticmethod
     def _guess_job_type(text: str) -> Optional[str]:
@@ -1,13 +1,14 @@
 """Indeed UK web scraper – best-effort HTML parsing of search results."""
 import requests
-import time
 import random
 import re
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
+import orjson
 from urllib.parse import quote_plus
-from bs4 import BeautifulSoup
-from .base import BaseSource, JobData
+from selectolax.lexbor import LexborHTMLParser
+from .base import BaseSource, JobData, HostRateLimiter, guess_experience
 
 
 class IndeedSource(BaseSource):
@@ -33,6 +34,33 @@ class IndeedSource(BaseSource):
         'Upgrade-Insecure-Requests': '1',
     }
 
+    # Queries run on a few threads, but every page request waits its turn
+    # on one limiter – Indeed blocks aggressive clients quickly.
+    MAX_WORKERS = 4
+    PAGE_DELAY = (3.0, 6.0)
+    MAX_CONSECUTIVE_FAILURES = 3
+    # 429/503 pages are retried after an exponential, jittered backoff
+    # that holds back every thread, not just the one that was refused
+    RETRY_STATUSES = frozenset({429, 503})
+    MAX_RETRIES = 3
+    BACKOFF_BASE = 5.0
+    BACKOFF_MAX = 60.0
+
+    # Job cards embedded in the results page as a JS assignment.  Pages
+    # are searched as raw bytes: orjson and Lexbor both take bytes, so
+    # the body is never decoded to a str.
+    JOB_JSON_MARKER = b'window.mosaic.providerData["mosaic-provider-jobcards"]'
+    JOB_JSON_RE = re.compile(
+        rb'window\.mosaic\.providerData\["mosaic-provider-jobcards"\]'
+        rb'\s*=\s*(?={)'
+    )
+    # JSON strings (whole, so braces inside them are skipped) and braces
+    JSON_TOKEN_RE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]', re.DOTALL)
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.limiter = HostRateLimiter(*self.PAGE_DELAY)
+
     def is_available(self) -> bool:
         return True  # Always available (web scraping)
 
@@ -49,33 +77,37 @@ class IndeedSource(BaseSource):
         session = requests.Session()
         session.headers.update(self.HEADERS)
 
+        lock = threading.Lock()
         consecutive_failures = 0
-        max_consecutive_failures = 3
 
-        for query in all_queries:
-            if consecutive_failures >= max_consecutive_failures:
-                self.logger.warning(
-                    f"Stopping Indeed scraper after {max_consecutive_failures} "
-                    "consecutive failures (site is blocking requests)"
-                )
-                break
+        def search_query(query: str) -> List[JobData]:
+            nonlocal consecutive_failures
+            if consecutive_failures >= self.MAX_CONSECUTIVE_FAILURES:
+                return []  # site is blocking us – drain the remaining queries
 
             try:
                 page_jobs = self._search(session, query)
-                jobs.extend(page_jobs)
                 self.logger.info(f"Found {len(page_jobs)} jobs for query '{query}'")
-                if page_jobs:
-                    consecutive_failures = 0
-                else:
-                    consecutive_failures += 1
             except Exception as e:
                 self.logger.error(f"Error searching for '{query}': {e}")
-                consecutive_failures += 1
+                page_jobs = []
 
-            time.sleep(random.uniform(
-                self.config.get('REQUEST_DELAY_MIN', 2.0),
-                self.config.get('REQUEST_DELAY_MAX', 5.0),
-            ))
+            with lock:
+                if page_jobs:
+                    consecutive_failures = 0
+                    return page_jobs
+                consecutive_failures += 1
+                if consecutive_failures == self.MAX_CONSECUTIVE_FAILURES:
+                    self.logger.warning(
+                        f"Stopping Indeed scraper after {consecutive_failures} "
+                        "consecutive failures (site is blocking requests)"
+                    )
+            return []
+
+        # map() keeps results in query order
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            for page_jobs in pool.map(search_query, all_queries):
+                jobs.extend(page_jobs)
 
         return jobs
 
@@ -92,7 +124,7 @@ class IndeedSource(BaseSource):
                     'start': page * 10,
                 }
 
-                response = session.get(url, params=params, timeout=30)
+                response = self._get(session, url, params)
 
                 if response.status_code == 403:
                     self.logger.warning("Access forbidden – rate limited")
@@ -102,21 +134,41 @@ class IndeedSource(BaseSource):
                     self.logger.warning(f"HTTP {response.status_code}")
                     break
 
-                page_jobs = self._parse_results(response.text)
+                page_jobs = self._parse_results(response.content)
                 jobs.extend(page_jobs)
 
                 if not page_jobs:
                     break
 
-                time.sleep(random.uniform(3.0, 6.0))
-
             except Exception as e:
                 self.logger.error(f"Page {page} error: {e}")
                 break
 
         return jobs
 
-    def _parse_results(self, html: str) -> List[JobData]:
+    def _get(
+        self, session: requests.Session, url: str, params: dict
+    ) -> requests.Response:
+        """GET a results page, backing off and retrying while it is throttled."""
+        for attempt in range(self.MAX_RETRIES + 1):
+            self.limiter.wait(url)
+            response = session.get(url, params=params, timeout=30)
+            if (response.status_code not in self.RETRY_STATUSES
+                    or attempt == self.MAX_RETRIES):
+                return response
+
+            delay = min(
+                self.BACKOFF_MAX,
+                self.BACKOFF_BASE * 2 ** attempt
+                + random.uniform(0, self.BACKOFF_BASE),
+            )
+            self.logger.warning(
+                f"HTTP {response.status_code} – backing off {delay:.0f}s"
+            )
+            self.limiter.defer(url, delay)
+        return response
+
+    def _parse_results(self, html: bytes) -> List[JobData]:
         """Parse Indeed search results page."""
         # Try embedded JSON first (more stable than HTML selectors)
         jobs_from_json = self._parse_json_data(html)
@@ -126,19 +178,23 @@ class IndeedSource(BaseSource):
         # Fallback: parse HTML directly
         return self._parse_html(html)
 
-    def _parse_json_data(self, html: str) -> List[JobData]:
+    def _parse_json_data(self, html: bytes) -> List[JobData]:
         """Extract job data from embedded JSON in the page."""
         jobs: List[JobData] = []
         try:
-            pattern = (
-                r'window\.mosaic\.providerData\["mosaic-provider-jobcards"\]'
-                r'\s*=\s*({.*?});'
-            )
-            match = re.search(pattern, html, re.DOTALL)
+            # A plain find skips the regex entirely on pages without the
+            # marker, and starts it at the marker on pages with it
+            pos = html.find(self.JOB_JSON_MARKER)
+            if pos < 0:
+                return []
+            match = self.JOB_JSON_RE.search(html, pos)
             if not match:
                 return []
+            body = self._balanced_object(html, match.end())
+            if body is None:
+                return []
 
-            data = json.loads(match.group(1))
+            data = orjson.loads(body)
             results = (
                 data.get('metaData', {})
                 .get('mosaicProviderJobCardsModel', {})
@@ -157,7 +213,7 @@ class IndeedSource(BaseSource):
                     url=f"{self.BASE_URL}/viewjob?jk={item.get('jobkey', '')}",
                     source='indeed_uk',
                     job_type=job_types[0] if job_types else None,
-                    experience_level=self._guess_experience(item.get('title', '')),
+                    experience_level=guess_experience(item.get('title', '')),
                 )
                 if job.is_valid():
                     jobs.append(job)
@@ -167,50 +223,69 @@ class IndeedSource(BaseSource):
 
         return jobs
 
-    def _parse_html(self, html: str) -> List[JobData]:
+    def _balanced_object(self, text: bytes, start: int) -> Optional[bytes]:
+        """The ``{...}`` opening at ``text[start]``, up to its matching brace.
+
+        Jumps from token to token instead of lazily matching up to the
+        first "};" – which also cut the object short whenever a string
+        in it contained "};".
+        """
+        depth = 0
+        for token in self.JSON_TOKEN_RE.finditer(text, start):
+            brace = token.group()
+            if brace == b'{':
+                depth += 1
+            elif brace == b'}':
+                depth -= 1
+                if depth == 0:
+                    return text[start:token.end()]
+        return None
+
+    def _parse_html(self, html: bytes) -> List[JobData]:
         """Fallback HTML parser for Indeed results."""
         jobs: List[JobData] = []
-        soup = BeautifulSoup(html, 'lxml')
+        tree = LexborHTMLParser(html)
 
-        job_cards = soup.select(
+        # Lexbor lists a node once per selector it matches; drop the repeats
+        job_cards = dict.fromkeys(tree.css(
             'div.job_seen_beacon, div.cardOutline, '
             'div.resultContent, li div[data-jk]'
-        )
+        ))
 
         for card in job_cards:
             try:
                 # Title
-                title_el = card.select_one(
+                title_el = card.css_first(
                     'h2.jobTitle a, h2 a, a[data-jk], '
                     'span[id^="jobTitle"]'
                 )
-                title = title_el.get_text(strip=True) if title_el else ''
+                title = title_el.text(strip=True) if title_el else ''
 
                 # Job key / URL
                 jk = None
-                link_el = card.select_one('a[data-jk]')
+                link_el = card.css_first('a[data-jk]')
                 if link_el:
-                    jk = link_el.get('data-jk', '')
-                elif title_el and title_el.get('href'):
-                    href = title_el['href']
+                    jk = link_el.attributes.get('data-jk') or ''
+                elif title_el and title_el.attributes.get('href'):
+                    href = title_el.attributes['href']
                     if 'jk=' in href:
                         jk = href.split('jk=')[1].split('&')[0]
 
                 url = f"{self.BASE_URL}/viewjob?jk={jk}" if jk else ''
 
                 # Company
-                company_el = card.select_one(
+                company_el = card.css_first(
                     '[data-testid="company-name"], '
                     'span.companyName, .company'
                 )
-                company = company_el.get_text(strip=True) if company_el else ''
+                company = company_el.text(strip=True) if company_el else ''
 
                 # Location
-                location_el = card.select_one(
+                location_el = card.css_first(
                     '[data-testid="text-location"], '
                     'div.companyLocation, .location'
                 )
-                location = location_el.get_text(strip=True) if location_el else ''
+                location = location_el.text(strip=True) if location_el else ''
 
                 job = JobData(
                     title=title,
@@ -218,7 +293,7 @@ class IndeedSource(BaseSource):
                     location=location,
                     url=url,
                     source='indeed_uk',
-                    experience_level=self._guess_experience(title),
+                    experience_level=guess_experience(title),
                 )
 
                 if job.is_valid():
@@ -229,18 +304,3 @@ class IndeedSource(BaseSource):
                 continue
 
         return jobs
-
-    @staticmethod
-    def _guess_experience(title: str) -> Optional[str]:
-        tl = title.lower()
-        if any(k in tl for k in ('senior', 'sr.', 'lead', 'principal', 'staff')):
-            return 'Senior Level'
-        if any(k in tl for k in ('junior', 'jr.', 'entry', 'graduate', 'trainee', 'intern')):
-            return 'Entry Level'
-        if any(k in tl for k in ('mid', 'intermediate')):
-            return 'Mid Level'
-        if any(k in tl for k in ('director', 'head of', 'vp ', 'vice president', 'chief')):
-            return 'Director / Executive'
-        if 'manager' in tl:
-            return 'Manager'
-        return None
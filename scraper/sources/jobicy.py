@@ -7,6 +7,7 @@ API endpoint: https://jobicy.com/api/v2/remote-jobs
 import requests
 import logging
 from typing import List, Optional
+import orjson
 from .base import BaseSource, JobData
 
 
@@ -39,7 +40,7 @@ class JobicySource(BaseSource):
                 timeout=30,
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
             raw_jobs = data.get("jobs", [])
             self.logger.info(f"Jobicy returned {len(raw_jobs)} jobs")
 
@@ -1,10 +1,8 @@
 """Reed.co.uk API job source – free UK job board API."""
-import requests
-import base64
-import time
-import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
-from .base import BaseSource, JobData
+import orjson
+from .base import BaseSource, JobData, HostRateLimiter, pooled_session, guess_experience
 
 
 class ReedSource(BaseSource):
@@ -13,6 +11,20 @@ class ReedSource(BaseSource):
     name = "reed"
     BASE_URL = "https://www.reed.co.uk/api/1.0/search"
 
+    # Queries run on a few threads; every request still waits its turn
+    # on one limiter, spaced REQUEST_DELAY_MIN–MAX seconds apart.
+    MAX_WORKERS = 4
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.session = pooled_session(pool_size=self.MAX_WORKERS)
+        # Reed takes the API key as the Basic-auth username, blank password
+        self.session.auth = (config.get('REED_API_KEY', ''), '')
+        self.limiter = HostRateLimiter(
+            config.get('REQUEST_DELAY_MIN', 1.0),
+            config.get('REQUEST_DELAY_MAX', 3.0),
+        )
+
     def is_available(self) -> bool:
         return bool(self.config.get('REED_API_KEY'))
 
@@ -25,25 +37,23 @@ class ReedSource(BaseSource):
 
         all_queries.extend(general_queries)
 
-        for query in all_queries:
-            try:
-                page_jobs = self._search(query)
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            for page_jobs in pool.map(self._search_query, all_queries):
                 jobs.extend(page_jobs)
-                self.logger.info(f"Found {len(page_jobs)} jobs for query '{query}'")
-            except Exception as e:
-                self.logger.error(f"Error searching for '{query}': {e}")
-
-            time.sleep(random.uniform(
-                self.config.get('REQUEST_DELAY_MIN', 1.0),
-                self.config.get('REQUEST_DELAY_MAX', 3.0),
-            ))
 
         return jobs
 
+    def _search_query(self, query: str) -> List[JobData]:
+        try:
+            page_jobs = self._search(query)
+            self.logger.info(f"Found {len(page_jobs)} jobs for query '{query}'")
+            return page_jobs
+        except Exception as e:
+            self.logger.error(f"Error searching for '{query}': {e}")
+            return []
+
     def _search(self, query: str) -> List[JobData]:
         jobs: List[JobData] = []
-        api_key = self.config['REED_API_KEY']
-        auth = base64.b64encode(f"{api_key}:".encode()).decode()
         max_results = self.config.get('MAX_RESULTS_PER_COMPANY', 100)
         results_per_page = 100
 
@@ -55,13 +65,13 @@ class ReedSource(BaseSource):
                     'resultsToTake': results_per_page,
                     'resultsToSkip': skip,
                 }
-                headers = {'Authorization': f'Basic {auth}'}
 
-                response = requests.get(
-                    self.BASE_URL, params=params, headers=headers, timeout=30,
+                self.limiter.wait(self.BASE_URL)
+                response = self.session.get(
+                    self.BASE_URL, params=params, timeout=30,
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 results = data.get('results', [])
                 if not results:
@@ -79,7 +89,7 @@ class ReedSource(BaseSource):
                         url=url,
                         source='reed',
                         job_type=self._get_job_type(item),
-                        experience_level=self._guess_experience(item.get('jobTitle', '')),
+                        experience_level=guess_experience(item.get('jobTitle', '')),
                     )
                     if job.is_valid():
                         jobs.append(job)
@@ -88,8 +98,6 @@ class ReedSource(BaseSource):
                 if skip + results_per_page >= total:
                     break
 
-                time.sleep(random.uniform(0.5, 1.5))
-
             except Exception as e:
                 self.logger.error(f"Page error for '{query}': {e}")
                 break
@@ -106,18 +114,3 @@ class ReedSource(BaseSource):
         if item.get('contractType'):
             parts.append(item['contractType'])
         return ', '.join(parts) if parts else None
-
-    @staticmethod
-    def _guess_experience(title: str) -> Optional[str]:
-        tl = title.lower()
-        if any(k in tl for k in ('senior', 'sr.', 'lead', 'principal', 'staff')):
-            return 'Senior Level'
-        if any(k in tl for k in ('junior', 'jr.', 'entry', 'graduate', 'trainee', 'intern')):
-            return 'Entry Level'
-        if any(k in tl for k in ('mid', 'intermediate')):
-            return 'Mid Level'
-        if any(k in tl for k in ('director', 'head of', 'vp ', 'vice president', 'chief')):
-            return 'Director / Executive'
-        if 'manager' in tl:
-            return 'Manager'
-        return None
@@ -1,8 +1,9 @@
 """Remotive API – free remote job board API, no authentication required."""
 import requests
 import logging
-from typing import List, Optional
-from .base import BaseSource, JobData
+from typing import List
+import orjson
+from .base import BaseSource, JobData, guess_experience
 
 
 class RemotiveSource(BaseSource):
@@ -35,19 +36,26 @@ class RemotiveSource(BaseSource):
                 self.logger.warning(f"HTTP {resp.status_code}")
                 return jobs
 
-            data = resp.json()
+            data = orjson.loads(resp.content)
             items = data.get('jobs', [])
 
             for item in items:
+                # Skip incomplete listings before classifying the title
+                title = item.get('title') or ''
+                url = item.get('url') or ''
+                if not (title.strip() and url.strip()
+                        and (item.get('company_name') or '').strip()):
+                    continue
+
                 candidate_location = item.get('candidate_required_location', '') or ''
                 job = JobData(
-                    title=item.get('title', ''),
+                    title=title,
                     company=item.get('company_name', ''),
                     location=candidate_location if candidate_location else 'Remote',
-                    url=item.get('url', ''),
+                    url=url,
                     source='remotive',
                     category=item.get('category', None),
-                    experience_level=self._guess_experience(item.get('title', '')),
+                    experience_level=guess_experience(title),
                     job_type=item.get('job_type', '').replace('_', ' ').title() or None,
                 )
                 if job.is_valid():
@@ -59,18 +67,3 @@ class RemotiveSource(BaseSource):
             self.logger.error(f"Error fetching Remotive jobs: {e}")
 
         return jobs
-
-    @staticmethod
-    def _guess_experience(title: str) -> Optional[str]:
-        tl = title.lower()
-        if any(k in tl for k in ('senior', 'sr.', 'lead', 'principal', 'staff')):
-            return 'Senior Level'
-        if any(k in tl for k in ('junior', 'jr.', 'entry', 'graduate', 'trainee', 'intern')):
-            return 'Entry Level'
-        if any(k in tl for k in ('mid', 'intermediate')):
-            return 'Mid Level'
-        if any(k in tl for k in ('director', 'head of', 'vp ', 'vice president', 'chief')):
-            return 'Director / Executive'
-        if 'manager' in tl:
-            return 'Manager'
-        return None
@@ -3,12 +3,11 @@ The Muse API – free job board with thousands of real UK listings.
 No authentication required.  Supports location and category filtering.
 https://www.themuse.com/developers/api/v2
 """
-import requests
-import time
-import random
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
-from .base import BaseSource, JobData
+import orjson
+from .base import BaseSource, JobData, HostRateLimiter, pooled_session
 
 
 class TheMuseSource(BaseSource):
@@ -33,6 +32,16 @@ class TheMuseSource(BaseSource):
         "Senior Level",
     ]
 
+    # Pages are fetched a few at a time, their starts still spaced
+    # PAGE_DELAY seconds apart.
+    MAX_WORKERS = 4
+    PAGE_DELAY = (0.3, 0.8)
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.session = pooled_session(pool_size=self.MAX_WORKERS)
+        self.limiter = HostRateLimiter(*self.PAGE_DELAY)
+
     def is_available(self) -> bool:
         return True  # Always available – no API key
 
@@ -43,13 +52,33 @@ class TheMuseSource(BaseSource):
         seen_ids: set = set()
         max_pages_per_location = self.config.get('MAX_PAGES_PER_SOURCE', 5)
 
-        target_set = {c.lower() for c in companies}
-
-        for location in self.UK_LOCATIONS:
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            # Page 0 of every location first, for the page counts …
+            firsts = list(pool.map(
+                lambda location: self._fetch_page(location, 0), self.UK_LOCATIONS
+            ))
+            # … then every remaining page of every location at once
+            rest_keys = [
+                (location, page)
+                for location, first in zip(self.UK_LOCATIONS, firsts)
+                if first is not None
+                for page in range(1, self._page_count(first, max_pages_per_location))
+            ]
+            rest = dict(zip(
+                rest_keys, pool.map(lambda key: self._fetch_page(*key), rest_keys)
+            ))
+
+        # Pages are handled in (location, page) order, so seen_ids dedup
+        # is the same as fetching them one by one
+        for location, first in zip(self.UK_LOCATIONS, firsts):
+            if first is None:
+                continue
+            pages = [first] + [
+                rest[(location, page)]
+                for page in range(1, self._page_count(first, max_pages_per_location))
+            ]
             try:
-                loc_jobs = self._fetch_location(
-                    location, max_pages_per_location, seen_ids, target_set
-                )
+                loc_jobs = self._collect_location(location, pages, seen_ids)
                 jobs.extend(loc_jobs)
                 self.logger.info(
                     f"Fetched {len(loc_jobs)} jobs for '{location}'"
@@ -57,110 +86,118 @@ class TheMuseSource(BaseSource):
             except Exception as e:
                 self.logger.error(f"Error fetching '{location}': {e}")
 
-            time.sleep(random.uniform(0.5, 1.5))
-
         self.logger.info(f"The Muse total: {len(jobs)} UK jobs extracted")
         return jobs
 
-    def _fetch_location(
-        self,
-        location: str,
-        max_pages: int,
-        seen_ids: set,
-        target_set: set,
+    @staticmethod
+    def _page_count(first: dict, max_pages: int) -> int:
+        return min(max_pages, max(first.get("page_count", 0), 1))
+
+    def _collect_location(
+        self, location: str, pages: List[Optional[dict]], seen_ids: set
     ) -> List[JobData]:
+        """Jobs from *location*'s pages, up to the first failed or empty one."""
         jobs: List[JobData] = []
 
-        for page in range(max_pages):
+        for page, data in enumerate(pages):
+            if data is None:
+                break
+            results = data.get("results", [])
+            if not results:
+                break
             try:
-                resp = requests.get(
-                    self.BASE_URL,
-                    params={"location": location, "page": page},
-                    timeout=30,
-                    headers={"Accept": "application/json"},
-                )
-                if resp.status_code != 200:
-                    self.logger.warning(
-                        f"HTTP {resp.status_code} for {location} page {page}"
-                    )
-                    break
-
-                data = resp.json()
-                results = data.get("results", [])
-                if not results:
-                    break
-
-                for item in results:
-                    job_id = item.get("id")
-                    if job_id in seen_ids:
-                        continue
-                    seen_ids.add(job_id)
-
-                    company_info = item.get("company", {})
-                    company_name = company_info.get("name", "")
-
-                    # Build location string from the locations list
-                    locs = item.get("locations", [])
-                    loc_names = [
-                        loc.get("name", "")
-                        for loc in locs
-                        if loc.get("name", "")
-                    ]
-                    loc_str = ", ".join(loc_names) if loc_names else location
-
-                    # Build the direct job URL
-                    landing = item.get("refs", {}).get("landing_page", "")
-                    if not landing:
-                        short_name = item.get("short_name", "")
-                        if short_name:
-                            landing = f"https://www.themuse.com/jobs/{company_name.lower().replace(' ','-')}/{short_name}"
-
-                    # Determine experience level from the API levels
-                    levels = item.get("levels", [])
-                    exp_level = None
-                    if levels:
-                        level_name = levels[0].get("name", "")
-                        if level_name:
-                            exp_level = level_name
-
-                    # Category from tags / categories
-                    categories = item.get("categories", [])
-                    category = categories[0].get("name") if categories else None
-
-                    # Check if this is a priority company
-                    is_priority = company_name.lower() in target_set
-
-                    job = JobData(
-                        title=item.get("name", ""),
-                        company=company_name,
-                        location=loc_str,
-                        url=landing,
-                        source="themuse",
-                        category=category,
-                        experience_level=exp_level,
-                        job_type=self._guess_job_type(
-                            item.get("name", ""), loc_str
-                        ),
-                    )
-
-                    if job.is_valid():
-                        jobs.append(job)
-
-                # Check if there are more pages
-                page_count = data.get("page_count", 0)
-                if page + 1 >= page_count:
-                    break
-
-                time.sleep(random.uniform(0.3, 0.8))
-
+                jobs.extend(self._parse_results(results, location, seen_ids))
             except Exception as e:
-                self.logger.error(
-                    f"Page {page} error for {location}: {e}"
-                )
+                self.logger.error(f"Page {page} error for {location}: {e}")
                 break
 
         return jobs
 
+    def _fetch_page(self, location: str, page: int) -> Optional[dict]:
+        try:
+            self.limiter.wait(self.BASE_URL)
+            resp = self.session.get(
+                self.BASE_URL,
+                params={"location": location, "page": page},
+                timeout=30,
+                headers={"Accept": "application/json"},
+            )
+            if resp.status_code != 200:
+                self.logger.warning(
+                    f"HTTP {resp.status_code} for {location} page {page}"
+                )
+                return None
+            return orjson.loads(resp.content)
+        except Exception as e:
+            self.logger.error(
+                f"Page {page} error for {location}: {e}"
+            )
+            return None
+
+    def _parse_results(
+        self, results: list, location: str, seen_ids: set
+    ) -> List[JobData]:
+        jobs: List[JobData] = []
+        for item in results:
+            job_id = item.get("id")
+            if job_id in seen_ids:
+                continue
+            seen_ids.add(job_id)
+
+            company_info = item.get("company", {})
+            company_name = company_info.get("name", "")
+            title = item.get("name", "")
+
+            # Build the direct job URL
+            landing = item.get("refs", {}).get("landing_page", "")
+            if not landing:
+                short_name = item.get("short_name", "")
+                if short_name:
+                    landing = f"https://www.themuse.com/jobs/{company_name.lower().replace(' ','-')}/{short_name}"
+
+            # Skip incomplete listings before building the rest of the job
+            if not (title and title.strip() and company_name
+                    and company_name.strip() and landing and landing.strip()):
+                continue
+
+            # Build location string from the locations list
+            locs = item.get("locations", [])
+            loc_names = [
+                loc.get("name", "")
+                for loc in locs
+                if loc.get("name", "")
+            ]
+            loc_str = ", ".join(loc_names) if loc_names else location
+
+            # Determine experience level from the API levels
+            levels = item.get("levels", [])
+            exp_level = None
+            if levels:
+                level_name = levels[0].get("name", "")
+                if level_name:
+                    exp_level = level_name
+
+            # Category from tags / categories
+            categories = item.get("categories", [])
+            category = categories[0].get("name") if categories else None
+
+            job = JobData(
+                title=title,
+                company=company_name,
+                location=loc_str,
+                url=landing,
+                source="themuse",
+                category=category,
+                experience_level=exp_level,
+                job_type=self._guess_job_type(title, loc_str),
+            )
+
+            if job.is_valid():
+                jobs.append(job)
+
+
+        return jobs
+
     @staticmethod
     def _guess_job_type(title: str, location: str) -> Optional[str]:
         parts = []
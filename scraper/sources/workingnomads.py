@@ -6,7 +6,9 @@ API endpoint: https://www.workingnomads.com/api/exposed_jobs/
 """
 import requests
 import logging
+from itertools import islice
 from typing import List, Optional
+import orjson
 from .base import BaseSource, JobData
 
 
@@ -31,7 +33,7 @@ class WorkingNomadsSource(BaseSource):
                 headers={"Accept": "application/json"},
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
 
             if not isinstance(data, list):
                 self.logger.error("Unexpected Working Nomads response")
@@ -72,12 +74,14 @@ class WorkingNomadsSource(BaseSource):
         location = (item.get("location") or "Remote").strip()
         category = (item.get("category_name") or "").strip() or None
 
-        # Tags may contain useful info
+        # Tags may contain useful info – only the first three are used
         tags = item.get("tags", "")
-        if isinstance(tags, str) and tags:
-            tag_list = [t.strip() for t in tags.split(",") if t.strip()]
-            if not category and tag_list:
-                category = ", ".join(tag_list[:3])
+        if not category and isinstance(tags, str) and tags:
+            tag_list = list(islice(
+                filter(None, (t.strip() for t in tags.split(","))), 3
+            ))
+            if tag_list:
+                category = ", ".join(tag_list)
 
         return JobData(
             title=title,
@@ -16,6 +16,10 @@ const state = {
   totalPages: 0,
 };
 
+const SCRAPE_POLL_MS = 5000;
+// Stop polling after ~30 min – a run whose worker died stays 'running'
+const SCRAPE_MAX_POLLS = (30 * 60 * 1000) / SCRAPE_POLL_MS;
+
 // ── DOM refs ─────────────────────────────────────────────────────
 const $  = (sel) => document.querySelector(sel);
 const $$ = (sel) => document.querySelectorAll(sel);
@@ -291,7 +295,8 @@ async function loadScrapeStatus() {
     const data = await res.json();
     if (data.status && data.status !== 'no_runs') {
       dom.lastRunBadge.classList.remove('d-none');
-      const badge = data.status === 'completed' ? 'bg-success' : 'bg-danger';
+      const badge = data.status === 'completed' ? 'bg-success'
+                  : data.status === 'running' ? 'bg-warning' : 'bg-danger';
       dom.lastRunBadge.className = `badge ${badge}`;
       dom.lastRunBadge.textContent = `Last: ${data.date} (${data.new_jobs || 0} new)`;
     }
@@ -397,7 +402,12 @@ async function triggerScrape() {
 
   try {
     const res  = await fetch('/api/scrape', { method: 'POST' });
-    const data = await res.json();
+    let data   = await res.json();
+
+    if (data.status === 'started') {
+      loadScrapeStatus();
+      data = await waitForScrape(data.last_run_id);
+    }
 
     if (data.status === 'completed') {
       dom.scrapeBody.innerHTML =
@@ -407,6 +417,18 @@ async function triggerScrape() {
       loadJobs();
       loadStats();
       loadScrapeStatus();
+    } else if (data.status === 'timeout') {
+      dom.scrapeBody.innerHTML =
+        '<i class="bi bi-hourglass-split text-warning fs-1 mb-3 d-block"></i>' +
+        '<p class="mb-1"><strong>The scrape is still running</strong></p>' +
+        '<p class="text-muted small">Check the scrape status again later.</p>';
+      loadScrapeStatus();
+    } else if (data.status === 'busy') {
+      dom.scrapeBody.innerHTML =
+        '<i class="bi bi-hourglass-split text-warning fs-1 mb-3 d-block"></i>' +
+        '<p class="mb-1"><strong>A scrape is already running</strong></p>' +
+        '<p class="text-muted small">Wait for it to finish, then refresh.</p>';
+      loadScrapeStatus();
     } else if (data.status === 'unavailable') {
       dom.scrapeBody.innerHTML =
         '<i class="bi bi-info-circle-fill text-warning fs-1 mb-3 d-block"></i>' +
@@ -425,6 +447,20 @@ async function triggerScrape() {
   }
 }
 
+// The scrape runs server-side in the background; poll until a run newer
+// than `lastRunId` has finished, or give up with status 'timeout'.
+async function waitForScrape(lastRunId) {
+  for (let poll = 0; poll < SCRAPE_MAX_POLLS; poll++) {
+    await new Promise((resolve) => setTimeout(resolve, SCRAPE_POLL_MS));
+    const res  = await fetch('/api/scrape/status');
+    const data = await res.json();
+    if (data.id && data.id !== lastRunId && data.status !== 'running') {
+      return data;
+    }
+  }
+  return { status: 'timeout' };
+}
+
 // ── Sort Indicators ──────────────────────────────────────────────
 function updateSortIndicators() {
   $$('.sortable').forEach((th) => {